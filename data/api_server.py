@@ -6,16 +6,56 @@ This Flask-based API serves the collected and processed data as JSON
 endpoints for the frontend dashboard to consume.
 """
 
-from flask import Flask, jsonify, send_from_directory
+from flask import Flask, request, send_from_directory
 from flask_cors import CORS
 from pathlib import Path
-import json
 from datetime import datetime
+from collections import OrderedDict
+from functools import partial
+from itertools import islice
+from typing import Any, Dict, Optional, Tuple
+import hashlib
 import logging
+import mmap
+import os
+import threading
+import time
+
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library if orjson is missing
+    orjson = None
+    import json
+
+try:
+    import ijson
+except ImportError:  # Large snapshots are parsed in full without ijson
+    ijson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:  # Dashboard digests are built from the JSON snapshots without pyarrow
+    pq = None
+
+try:
+    from flask_compress import Compress
+except ImportError:  # Responses are sent uncompressed without flask-compress
+    Compress = None
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for frontend requests
 
+# WSGI entry point for production servers (see gunicorn.conf.py)
+application = app
+
+# Compress JSON responses (Brotli when the client supports it, gzip otherwise)
+app.config['COMPRESS_MIMETYPES'] = ['application/json']
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+if Compress is not None:
+    Compress(app)
+
 # Configure paths
 DATA_DIR = Path('./collected_data')
 PROCESSED_DIR = Path('./processed_data')
@@ -24,44 +64,398 @@ PROCESSED_DIR = Path('./processed_data')
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Parsed JSON files keyed by path, least recently used first
+_CACHE: 'OrderedDict[str, _CacheEntry]' = OrderedDict()
+_CACHE_LOCK = threading.Lock()
+_CACHE_MAX_ENTRIES = 32
+
+# Files above this size are parsed straight from a memory map instead of a copied buffer
+_MMAP_READ_BYTES = 4 * 1024 * 1024
+# Deployment snapshots above this size are streamed for the dashboard instead of parsed whole
+_STREAM_DIGEST_BYTES = 32 * 1024 * 1024
+_DASHBOARD_SAMPLE_SIZE = 100
+
+# Data only changes when the collector runs, so let browsers reuse responses briefly
+_CACHE_CONTROL = 'public, max-age=15'
+
+# (deployments entry, network entry, body, etag, offset of the timestamp value in body)
+_dashboard_body: Tuple[Any, Any, bytes, str, int] = (None, None, b'', '', 0)
+# (epoch second, ISO string) for the last formatted response timestamp
+_now_iso: Tuple[int, str] = (0, '')
+
+# Newest snapshot per (directory, pattern), stored as (directory st_mtime_ns, path)
+_LATEST: Dict[Tuple[str, str], Tuple[int, Optional[Path]]] = {}
+
+# Aggregation intervals served by /api/stats/<interval>, with their (costs, resources) files
+_INTERVALS = ('hourly', 'daily', 'weekly', 'monthly')
+_STATS_FILES = {interval: (f'costs_{interval}.json', f'resources_{interval}.json') for interval in _INTERVALS}
+
+# Files served by the API, parsed ahead of requests by the background refresher
+# (real_deployments is only read by the dashboard, which warms its own digest)
+_SNAPSHOT_PATTERNS = ('deployment_costs', 'network_statistics', 'lease_resources')
+_PROCESSED_FILES = ('provider_statistics.json', 'dashboard_summary.json') + tuple(
+    filename for files in _STATS_FILES.values() for filename in files
+)
+
+# Set to wake the background refresher as soon as a data directory changes
+_refresh_wakeup = threading.Event()
+
+
+def _loads(raw: bytes):
+    """Parse raw JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(obj) -> bytes:
+    """Serialize an object to JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, default=str).encode()
+
+
+def _iso_now() -> str:
+    """Return the current local time in ISO format, formatting it at most once per second"""
+    global _now_iso
+    now = int(time.time())
+    second, text = _now_iso
+    if now != second:
+        text = datetime.fromtimestamp(now).isoformat()
+        _now_iso = (now, text)
+    return text
+
+
+def _json_response(obj, status: int = 200):
+    """Serialize an object into a JSON response"""
+    return app.response_class(_dumps(obj), status=status, mimetype='application/json')
+
+
+class _CacheEntry:
+    """Parsed contents of one version of a data file, plus values derived from it"""
+
+    __slots__ = ('path', 'mtime_ns', 'size', 'data', 'derived')
+
+    def __init__(self, path: Path, mtime_ns: int, size: int, data: Any):
+        self.path = path
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.data = data
+        self.derived: Dict[str, Any] = {}
+
+    def derive(self, name: str, build):
+        """Return build(data), computing it only once for this version of the file"""
+        value = self.derived.get(name)
+        if value is None:
+            value = self.derived[name] = build(self.data)
+        return value
+
+
+def _cache_entry(path: Path, stream=None) -> _CacheEntry:
+    """Load a JSON file, reusing the parsed entry until the file changes on disk
+
+    With ``stream`` the file is not parsed in full; its entry holds ``stream(file)`` instead.
+    """
+    st = path.stat()
+    key = str(path) if stream is None else f"{path}#{stream.__name__}"
+    with _CACHE_LOCK:
+        entry = _CACHE.get(key)
+        if entry is not None and entry.mtime_ns == st.st_mtime_ns and entry.size == st.st_size:
+            _CACHE.move_to_end(key)
+            return entry
+
+    logger.info(f"Loading {path}")
+    if stream is not None:
+        with open(path, 'rb') as f:
+            data = stream(f)
+    elif orjson is not None and st.st_size > _MMAP_READ_BYTES:
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                data = orjson.loads(view)
+    else:
+        data = _loads(path.read_bytes())
+
+    entry = _CacheEntry(path, st.st_mtime_ns, st.st_size, data)
+    with _CACHE_LOCK:
+        _CACHE[key] = entry
+        _CACHE.move_to_end(key)
+        # Older timestamped snapshots fall out once newer ones are loaded
+        while len(_CACHE) > _CACHE_MAX_ENTRIES:
+            _CACHE.popitem(last=False)
+    return entry
+
+
+def _scan_latest(directory: Path, pattern: str) -> Optional[Path]:
+    """Find the newest `<pattern>_*.json` file in a single directory pass"""
+    # Snapshot names embed a sortable timestamp, so the greatest name is the newest
+    prefix = f"{pattern}_"
+    latest = None
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith(prefix) and name.endswith('.json') and (latest is None or name > latest):
+                    latest = name
+    except FileNotFoundError:
+        return None
+    return directory / latest if latest is not None else None
 
-def load_latest_file(directory: Path, pattern: str):
-    """Load the most recent file matching the pattern"""
+
+def _latest_path(directory: Path, pattern: str) -> Optional[Path]:
+    """Find the newest `<pattern>_*.json` file, rescanning only when the directory changes"""
+    try:
+        dir_mtime = directory.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    key = (str(directory), pattern)
+    hit = _LATEST.get(key)
+    if hit is not None and hit[0] == dir_mtime:
+        return hit[1]
+
+    latest = _scan_latest(directory, pattern)
+    _LATEST[key] = (dir_mtime, latest)
+    return latest
+
+
+def _latest_entry(directory: Path, pattern: str) -> Optional[_CacheEntry]:
+    """Load the cache entry for the most recent file matching the pattern"""
     try:
-        files = sorted(directory.glob(f"{pattern}_*.json"))
-        if not files:
+        latest_file = _latest_path(directory, pattern)
+        if latest_file is None:
             logger.warning(f"No files found matching {pattern}")
             return None
 
-        latest_file = files[-1]
-        logger.info(f"Loading {latest_file}")
-
-        with open(latest_file, 'r') as f:
-            return json.load(f)
+        return _cache_entry(latest_file)
     except Exception as e:
         logger.error(f"Error loading file {pattern}: {e}")
         return None
 
 
-def load_processed_file(filename: str):
-    """Load a processed data file"""
-    try:
-        file_path = PROCESSED_DIR / filename
-        if not file_path.exists():
-            logger.warning(f"Processed file not found: {filename}")
-            return None
+def load_latest_file(directory: Path, pattern: str):
+    """Load the most recent file matching the pattern"""
+    entry = _latest_entry(directory, pattern)
+    return entry.data if entry is not None else None
+
 
-        with open(file_path, 'r') as f:
-            return json.load(f)
+def _processed_entry(filename: str) -> Optional[_CacheEntry]:
+    """Load the cache entry for a processed data file"""
+    try:
+        return _cache_entry(PROCESSED_DIR / filename)
+    except FileNotFoundError:
+        logger.warning(f"Processed file not found: {filename}")
+        return None
     except Exception as e:
         logger.error(f"Error loading processed file {filename}: {e}")
         return None
 
 
+def load_processed_file(filename: str):
+    """Load a processed data file"""
+    entry = _processed_entry(filename)
+    return entry.data if entry is not None else None
+
+
+def _source_etag(*entries: Optional[_CacheEntry]) -> str:
+    """Build an ETag identifying the versions of the files a response was built from"""
+    digest = hashlib.blake2b(digest_size=16)
+    for entry in entries:
+        if entry is None:
+            digest.update(b'-;')
+        else:
+            digest.update(f"{entry.path}:{entry.mtime_ns}:{entry.size};".encode())
+    return digest.hexdigest()
+
+
+def _conditional_json(payload: Dict, *entries: Optional[_CacheEntry]):
+    """Respond with payload as JSON, or with 304 if the client already has this data version"""
+    etag = _source_etag(*entries)
+    if request.if_none_match.contains_weak(etag):
+        response = app.response_class(status=304)
+    else:
+        response = _json_response(payload)
+    # Weak, because the payload timestamp differs between otherwise identical responses
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = _CACHE_CONTROL
+    return response
+
+
+def _summarize_deployments(deployments) -> Dict:
+    """Compute dashboard summary totals from deployment records in a single pass"""
+    total_daily = total_monthly = 0.0
+    owners = set()
+    providers = set()
+    count = 0
+    for count, deployment in enumerate(deployments, 1):
+        # Real deployments carry an estimate, lease cost snapshots carry actual pricing
+        estimate = deployment.get('pricing_estimate')
+        if estimate:
+            total_daily += estimate.get('total_daily_usd', 0)
+            total_monthly += estimate.get('total_monthly_usd', 0)
+            providers.update(deployment.get('providers', ()))
+        else:
+            pricing = deployment.get('pricing') or {}
+            total_daily += pricing.get('daily_cost_usd', 0)
+            total_monthly += pricing.get('monthly_cost_usd', 0)
+            lease_id = deployment.get('lease_id')
+            if lease_id:
+                providers.add(lease_id.get('provider', ''))
+
+        deployment_id = deployment.get('deployment_id')
+        if deployment_id:
+            owners.add(deployment_id.get('owner', ''))
+
+    return {
+        'total_active_deployments': count,
+        'total_daily_cost_usd': round(total_daily, 2),
+        'total_monthly_cost_usd': round(total_monthly, 2),
+        'average_deployment_cost_monthly_usd': round(total_monthly / count, 2) if count else 0,
+        'unique_owners': len(owners),
+        'unique_providers': len(providers)
+    }
+
+
+def _digest_deployments(deployments) -> Dict:
+    """Reduce parsed deployment records to the sample and count the dashboard shows"""
+    if isinstance(deployments, dict):
+        deployments = [deployments]
+    elif not isinstance(deployments, list):
+        deployments = []
+    # The summary is left to the dashboard, which only needs it without network statistics
+    return {
+        'sample': deployments[:_DASHBOARD_SAMPLE_SIZE],
+        'total': len(deployments),
+        'summary': None,
+        'records': deployments
+    }
+
+
+def _stream_deployments_digest(f) -> Dict:
+    """Build the dashboard digest from a deployments file without materializing every record"""
+    sample = []
+
+    def records():
+        for deployment in ijson.items(f, 'item', use_float=True):
+            if len(sample) < _DASHBOARD_SAMPLE_SIZE:
+                sample.append(deployment)
+            yield deployment
+
+    summary = _summarize_deployments(records())
+    return {'sample': sample, 'total': summary['total_active_deployments'], 'summary': summary}
+
+
+def _struct_field(table, column: str, field: str):
+    """Return ``column.field`` from a Parquet table, or None when the file has no such field"""
+    if column not in table.column_names:
+        return None
+    column_type = table.schema.field(column).type
+    if not pa.types.is_struct(column_type) or column_type.get_field_index(field) < 0:
+        return None
+    return pc.struct_field(table[column], field)
+
+
+def _masked_sum(values, mask) -> float:
+    """Sum the non-null values selected by mask"""
+    if values is None:
+        return 0.0
+    return pc.sum(pc.filter(values, mask)).as_py() or 0.0
+
+
+def _json_sample(f) -> list:
+    """Read the first records of a JSON array snapshot for the dashboard sample"""
+    return list(islice(ijson.items(f, 'item', use_float=True), _DASHBOARD_SAMPLE_SIZE))
+
+
+def _parquet_deployments_digest(f) -> Dict:
+    """Build the dashboard summary from a Parquet copy, reading only the columns it needs
+
+    The sample is left to the JSON snapshot, since Parquet rows do not round-trip
+    exactly (missing keys come back as nulls, ints in float columns as floats).
+    """
+    parquet_file = pq.ParquetFile(f)
+    wanted = ('pricing_estimate', 'pricing', 'providers', 'lease_id', 'deployment_id')
+    table = parquet_file.read(columns=[c for c in wanted if c in parquet_file.schema_arrow.names])
+    count = table.num_rows
+
+    # Rows with an estimate are real deployments, the rest are lease cost snapshots
+    if 'pricing_estimate' in table.column_names:
+        estimated = pc.is_valid(table['pricing_estimate'])
+    else:
+        estimated = pa.array([False] * count)
+    leased = pc.invert(estimated)
+
+    total_daily = (_masked_sum(_struct_field(table, 'pricing_estimate', 'total_daily_usd'), estimated)
+                   + _masked_sum(_struct_field(table, 'pricing', 'daily_cost_usd'), leased))
+    total_monthly = (_masked_sum(_struct_field(table, 'pricing_estimate', 'total_monthly_usd'), estimated)
+                     + _masked_sum(_struct_field(table, 'pricing', 'monthly_cost_usd'), leased))
+
+    providers = set()
+    if 'providers' in table.column_names:
+        providers.update(pc.unique(pc.list_flatten(pc.filter(table['providers'], estimated))).to_pylist())
+    lease_providers = _struct_field(table, 'lease_id', 'provider')
+    if lease_providers is not None:
+        providers.update(pc.unique(pc.filter(lease_providers, leased)).to_pylist())
+    providers.discard(None)
+
+    owners = _struct_field(table, 'deployment_id', 'owner')
+    unique_owners = pc.count_distinct(owners).as_py() if owners is not None else 0
+
+    return {
+        'sample': None,
+        'total': count,
+        'summary': {
+            'total_active_deployments': count,
+            'total_daily_cost_usd': round(total_daily, 2),
+            'total_monthly_cost_usd': round(total_monthly, 2),
+            'average_deployment_cost_monthly_usd': round(total_monthly / count, 2) if count else 0,
+            'unique_owners': unique_owners,
+            'unique_providers': len(providers)
+        }
+    }
+
+
+def _parquet_sidecar(path: Path) -> Optional[Path]:
+    """Return the Parquet copy of a JSON snapshot if it was written after the JSON"""
+    sidecar = path.with_suffix('.parquet')
+    try:
+        if sidecar.stat().st_mtime_ns >= path.stat().st_mtime_ns:
+            return sidecar
+    except FileNotFoundError:
+        pass
+    return None
+
+
+def _deployments_digest(pattern: str) -> Tuple[Optional[_CacheEntry], Dict]:
+    """Return the cache entry behind the latest snapshot of ``pattern`` and its dashboard digest"""
+    path = _latest_path(DATA_DIR, pattern)
+    if path is None:
+        logger.warning(f"No files found matching {pattern}")
+        return None, _digest_deployments([])
+    # The Parquet copy only pays off when the sample can be streamed from the JSON
+    sidecar = _parquet_sidecar(path) if pq is not None and ijson is not None else None
+    if sidecar is not None:
+        try:
+            entry = _cache_entry(sidecar, _parquet_deployments_digest)
+            sample = _cache_entry(path, _json_sample).data
+            return entry, {**entry.data, 'sample': sample}
+        except Exception as e:
+            logger.warning(f"Error reading {sidecar}, falling back to JSON: {e}")
+    try:
+        # Huge snapshots are streamed, since the dashboard throws away all but 100 records
+        if ijson is not None and path.stat().st_size > _STREAM_DIGEST_BYTES:
+            entry = _cache_entry(path, _stream_deployments_digest)
+            return entry, entry.data
+        entry = _cache_entry(path)
+        return entry, entry.derive('digest', _digest_deployments)
+    except Exception as e:
+        logger.error(f"Error loading {pattern}: {e}")
+        return None, _digest_deployments([])
+
+
 @app.route('/')
 def index():
     """API index with available endpoints"""
-    return jsonify({
+    return _json_response({
         'name': 'Akalysis API',
         'version': '1.0.0',
         'description': 'Akash Network Monitoring API',
@@ -80,13 +474,13 @@ def index():
 def health():
     """Health check endpoint"""
     # Safely check for data availability
-    costs_available = any(DATA_DIR.glob('deployment_costs_*.json'))
-    resources_available = any(DATA_DIR.glob('lease_resources_*.json'))
+    costs_available = _latest_path(DATA_DIR, 'deployment_costs') is not None
+    resources_available = _latest_path(DATA_DIR, 'lease_resources') is not None
     summary_available = (PROCESSED_DIR / 'dashboard_summary.json').exists()
 
-    return jsonify({
+    return _json_response({
         'status': 'healthy',
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': _iso_now(),
         'data_available': {
             'costs': costs_available,
             'resources': resources_available,
@@ -95,159 +489,214 @@ def health():
     })
 
 
+def _build_dashboard(digest: Dict, network_entry: Optional[_CacheEntry]) -> Dict:
+    """Assemble the dashboard payload from the latest deployments digest and network statistics"""
+    network_stats = (network_entry.data if network_entry is not None else None) or {}
+
+    # Extract summary from network stats or fall back to the one computed from deployments
+    if network_stats:
+        summary = {
+            'total_active_deployments': network_stats.get('total_active_deployments', 0),
+            'total_daily_cost_usd': network_stats.get('total_estimated_daily_cost_usd', 0),
+            'total_monthly_cost_usd': network_stats.get('total_estimated_monthly_cost_usd', 0),
+            'average_deployment_cost_monthly_usd': network_stats.get('average_deployment_cost_monthly_usd', 0),
+            'unique_owners': network_stats.get('unique_owners', 0),
+            'unique_providers': network_stats.get('unique_providers', 0),
+            'resource_totals': network_stats.get('resource_totals', {}),
+            'cost_distribution': network_stats.get('cost_distribution', {}),
+            'is_estimate': True,
+            'disclaimer': network_stats.get('disclaimer', '')
+        }
+    elif digest['summary'] is not None:
+        summary = digest['summary']
+    else:
+        # The rendered body is cached per file version, so this runs once per snapshot
+        summary = _summarize_deployments(digest['records'])
+
+    # Sample deployments for the response (limit to prevent huge payloads)
+    sample_deployments = digest['sample']
+
+    return {
+        'timestamp': _iso_now(),
+        'summary': summary,
+        'deployments': sample_deployments,
+        'total_deployments': digest['total'],
+        'showing': len(sample_deployments),
+        'data_source': 'real_akash_network' if network_stats else 'test_data'
+    }
+
+
+def _dashboard_payload() -> Tuple[bytes, str, int]:
+    """Return the serialized dashboard body, its ETag and timestamp offset, rebuilding only when inputs change"""
+    global _dashboard_body
+
+    # Load REAL deployment data from Akash Network
+    deployments_entry, digest = _deployments_digest('real_deployments')
+    if not digest['total']:
+        deployments_entry, digest = _deployments_digest('deployment_costs')
+    network_entry = _latest_entry(DATA_DIR, 'network_statistics')
+
+    # Entries are replaced whenever their file changes, so identity marks unchanged inputs
+    cached_deployments, cached_network, body, etag, offset = _dashboard_body
+    if not body or cached_deployments is not deployments_entry or cached_network is not network_entry:
+        payload = _build_dashboard(digest, network_entry)
+        body = _dumps(payload)
+        etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+        # 'timestamp' is the first key, so its value is the first occurrence in the body
+        offset = body.index(payload['timestamp'].encode())
+        _dashboard_body = (deployments_entry, network_entry, body, etag, offset)
+    return body, etag, offset
+
+
 @app.route('/api/dashboard')
 def get_dashboard_data():
     """Get complete dashboard data - Now serving REAL Akash Network data!"""
     try:
-        # Load REAL deployment data from Akash Network
-        deployments = load_latest_file(DATA_DIR, 'real_deployments') or \
-                      load_latest_file(DATA_DIR, 'deployment_costs') or []
-        network_stats = load_latest_file(DATA_DIR, 'network_statistics') or {}
-
-        # Ensure deployments is a list
-        if isinstance(deployments, dict):
-            deployments = [deployments]
-
-        # Extract summary from network stats or calculate from deployments
-        if network_stats:
-            summary = {
-                'total_active_deployments': network_stats.get('total_active_deployments', 0),
-                'total_daily_cost_usd': network_stats.get('total_estimated_daily_cost_usd', 0),
-                'total_monthly_cost_usd': network_stats.get('total_estimated_monthly_cost_usd', 0),
-                'average_deployment_cost_monthly_usd': network_stats.get('average_deployment_cost_monthly_usd', 0),
-                'unique_owners': network_stats.get('unique_owners', 0),
-                'unique_providers': network_stats.get('unique_providers', 0),
-                'resource_totals': network_stats.get('resource_totals', {}),
-                'cost_distribution': network_stats.get('cost_distribution', {}),
-                'is_estimate': True,
-                'disclaimer': network_stats.get('disclaimer', '')
-            }
-        else:
-            summary = {
-                'total_active_deployments': len(deployments),
-                'total_daily_cost_usd': 0,
-                'total_monthly_cost_usd': 0,
-                'average_deployment_cost_monthly_usd': 0,
-                'unique_owners': 0,
-                'unique_providers': 0
-            }
-
-        # Sample deployments for the response (limit to prevent huge payloads)
-        sample_deployments = deployments[:100] if len(deployments) > 100 else deployments
-
-        response = {
-            'timestamp': datetime.now().isoformat(),
-            'summary': summary,
-            'deployments': sample_deployments,
-            'total_deployments': len(deployments),
-            'showing': len(sample_deployments),
-            'data_source': 'real_akash_network' if network_stats else 'test_data'
-        }
+        body, etag, offset = _dashboard_payload()
 
-        return jsonify(response)
+        # Stamp the current time over the fixed-width timestamp instead of re-serializing
+        now = _iso_now().encode()
+        body = body[:offset] + now + body[offset + len(now):]
+
+        response = app.response_class(body, mimetype='application/json')
+        # Weak, so the tag still matches after flask-compress re-encodes the body
+        response.set_etag(etag, weak=True)
+        response.headers['Cache-Control'] = _CACHE_CONTROL
+        return response.make_conditional(request)
 
     except Exception as e:
         logger.error(f"Error generating dashboard data: {e}")
-        return jsonify({
+        return _json_response({
             'error': str(e),
-            'timestamp': datetime.now().isoformat()
-        }), 500
+            'timestamp': _iso_now()
+        }, 500)
 
 
-@app.route('/api/costs')
-def get_costs():
-    """Get deployment cost data"""
-    try:
-        costs = load_latest_file(DATA_DIR, 'deployment_costs') or []
-        if isinstance(costs, dict):
-            costs = [costs]
-
-        return jsonify({
-            'timestamp': datetime.now().isoformat(),
-            'data': costs,
-            'count': len(costs)
-        })
-    except Exception as e:
-        logger.error(f"Error getting costs: {e}")
-        return jsonify({'error': str(e)}), 500
+def _as_list(data) -> list:
+    """Normalize a snapshot to a list of records"""
+    if isinstance(data, dict):
+        return [data]
+    return data or []
 
 
-@app.route('/api/resources')
-def get_resources():
-    """Get resource usage data"""
-    try:
-        resources = load_latest_file(DATA_DIR, 'lease_resources') or []
-        if isinstance(resources, dict):
-            resources = [resources]
-
-        return jsonify({
-            'timestamp': datetime.now().isoformat(),
-            'data': resources,
-            'count': len(resources)
-        })
-    except Exception as e:
-        logger.error(f"Error getting resources: {e}")
-        return jsonify({'error': str(e)}), 500
+def _provider_list(providers) -> list:
+    """Flatten provider statistics keyed by address into a list"""
+    return list(providers.values()) if isinstance(providers, dict) else []
 
 
-@app.route('/api/providers')
-def get_providers():
-    """Get provider statistics"""
-    try:
-        providers = load_processed_file('provider_statistics.json') or {}
-
-        # Convert to list
-        provider_list = []
-        if isinstance(providers, dict):
-            provider_list = list(providers.values())
-
-        return jsonify({
-            'timestamp': datetime.now().isoformat(),
-            'data': provider_list,
-            'count': len(provider_list)
-        })
-    except Exception as e:
-        logger.error(f"Error getting providers: {e}")
-        return jsonify({'error': str(e)}), 500
+def _as_dict(data) -> Dict:
+    """Normalize a missing or empty document to an empty dict"""
+    return data or {}
 
 
-@app.route('/api/summary')
-def get_summary():
-    """Get summary statistics"""
-    try:
-        summary = load_processed_file('dashboard_summary.json') or {}
+def _register_data_view(name: str, doc: str, load_entry, shape, counted: bool = True):
+    """Register GET /api/<name>, serving one data file reshaped by ``shape`` and cached per file version"""
+    def view():
+        try:
+            entry = load_entry()
+            data = entry.derive(name, shape) if entry is not None else shape(None)
 
-        return jsonify({
-            'timestamp': datetime.now().isoformat(),
-            'data': summary
-        })
-    except Exception as e:
-        logger.error(f"Error getting summary: {e}")
-        return jsonify({'error': str(e)}), 500
+            payload = {'timestamp': _iso_now(), 'data': data}
+            if counted:
+                payload['count'] = len(data)
+            return _conditional_json(payload, entry)
+        except Exception as e:
+            logger.error(f"Error getting {name}: {e}")
+            return _json_response({'error': str(e)}, 500)
+
+    view.__name__ = view.__qualname__ = f'get_{name}'
+    view.__doc__ = doc
+    app.add_url_rule(f'/api/{name}', view.__name__, view)
+    return view
+
+
+get_costs = _register_data_view(
+    'costs', "Get deployment cost data", partial(_latest_entry, DATA_DIR, 'deployment_costs'), _as_list)
+get_resources = _register_data_view(
+    'resources', "Get resource usage data", partial(_latest_entry, DATA_DIR, 'lease_resources'), _as_list)
+get_providers = _register_data_view(
+    'providers', "Get provider statistics", partial(_processed_entry, 'provider_statistics.json'), _provider_list)
+get_summary = _register_data_view(
+    'summary', "Get summary statistics", partial(_processed_entry, 'dashboard_summary.json'), _as_dict,
+    counted=False)
 
 
 @app.route('/api/stats/<interval>')
 def get_stats(interval):
     """Get aggregated statistics by interval (hourly, daily, weekly, monthly)"""
     try:
-        if interval not in ['hourly', 'daily', 'weekly', 'monthly']:
-            return jsonify({'error': 'Invalid interval. Use: hourly, daily, weekly, or monthly'}), 400
-
-        costs_file = f'costs_{interval}.json'
-        resources_file = f'resources_{interval}.json'
-
-        costs = load_processed_file(costs_file) or {}
-        resources = load_processed_file(resources_file) or {}
-
-        return jsonify({
-            'timestamp': datetime.now().isoformat(),
+        files = _STATS_FILES.get(interval)
+        if files is None:
+            return _json_response({'error': 'Invalid interval. Use: hourly, daily, weekly, or monthly'}, 400)
+
+        costs_file, resources_file = files
+        costs_entry = _processed_entry(costs_file)
+        resources_entry = _processed_entry(resources_file)
+        costs = (costs_entry.data if costs_entry is not None else None) or {}
+        resources = (resources_entry.data if resources_entry is not None else None) or {}
+
+        return _conditional_json({
+            'timestamp': _iso_now(),
             'interval': interval,
             'costs': costs,
             'resources': resources
-        })
+        }, costs_entry, resources_entry)
     except Exception as e:
         logger.error(f"Error getting stats for {interval}: {e}")
-        return jsonify({'error': str(e)}), 500
+        return _json_response({'error': str(e)}, 500)
+
+
+def refresh_cache():
+    """Parse new or changed data files into the cache so requests never wait on parsing"""
+    for pattern in _SNAPSHOT_PATTERNS:
+        _latest_entry(DATA_DIR, pattern)
+    for filename in _PROCESSED_FILES:
+        if (PROCESSED_DIR / filename).exists():
+            _processed_entry(filename)
+
+    try:
+        _dashboard_payload()
+    except Exception as e:
+        logger.error(f"Error pre-rendering dashboard data: {e}")
+
+
+def _refresh_loop(interval: float):
+    """Refresh the cache whenever woken by a file event, or every `interval` seconds"""
+    while True:
+        _refresh_wakeup.wait(interval)
+        _refresh_wakeup.clear()
+        try:
+            refresh_cache()
+        except Exception as e:
+            logger.error(f"Error refreshing data cache: {e}")
+
+
+def start_background_refresh(warm: bool = True):
+    """Warm the cache and keep it current from a daemon thread as collector output changes"""
+    if warm:
+        refresh_cache()
+
+    try:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+    except ImportError:
+        # Without watchdog, fall back to polling the data directories
+        interval = 5.0
+    else:
+        class _WakeRefresher(FileSystemEventHandler):
+            def on_any_event(self, event):
+                _refresh_wakeup.set()
+
+        observer = Observer()
+        observer.daemon = True
+        for directory in (DATA_DIR, PROCESSED_DIR):
+            if directory.is_dir():
+                observer.schedule(_WakeRefresher(), str(directory))
+        observer.start()
+        # Events drive refreshes; the slow poll only covers directories created later
+        interval = 60.0
+
+    threading.Thread(target=_refresh_loop, args=(interval,), name='akalysis-cache-refresh', daemon=True).start()
 
 
 if __name__ == '__main__':
@@ -268,4 +717,8 @@ if __name__ == '__main__':
 ╚═══════════════════════════════════════════════════════════╝
     """)
 
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    app.debug = True
+    # The debug reloader runs this module twice; only the child it spawns serves requests
+    if not app.debug or os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        start_background_refresh()
+    app.run(host='0.0.0.0', port=5000)
@@ -8,11 +8,13 @@ costs (leases) from the Akash Network blockchain.
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import List, Dict
 import click
+import numpy as np
+import pandas as pd
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
 # Add parent directory to path to import utils
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -23,21 +25,39 @@ from utils import (
     DataStorage,
     setup_logging,
     get_akt_price,
-    calculate_cost
+    calculate_cost_batch,
+    progress_spinner
 )
 from loguru import logger
 
 console = Console()
 
+# Shared read-only default for missing nested objects
+_EMPTY: Dict = {}
+
 
 class DeploymentCostCollector:
     """Collects deployment cost data from Akash Network"""
 
+    # Akash blocks are ~6 seconds, so ~14,400 blocks per day
+    BLOCKS_PER_DAY = 14400
+    BLOCKS_PER_MONTH = BLOCKS_PER_DAY * 30
+
     def __init__(self, config: Config):
         self.config = config
         self.api_client = AkashAPIClient(config)
         self.storage = DataStorage(config)
-        self.akt_price = get_akt_price(config)
+
+        # The price lookup is a separate HTTP call, so start it now and let it
+        # overlap with the lease collection instead of delaying it
+        executor = ThreadPoolExecutor(max_workers=1)
+        self._akt_price_future = executor.submit(get_akt_price, config)
+        executor.shutdown(wait=False)
+
+    @property
+    def akt_price(self) -> float:
+        """Current AKT/USD price, waiting for the lookup started at construction"""
+        return self._akt_price_future.result()
 
     def collect_deployments(self) -> List[Dict]:
         """Collect all active deployments"""
@@ -63,68 +83,90 @@ class DeploymentCostCollector:
         logger.info(f"Collected {len(leases)} leases")
         return leases
 
+    @staticmethod
+    def _lease_amount_uakt(lease: Dict) -> int:
+        """Extract the per-block lease price in uAKT"""
+        # Price is typically in the format of amount per block
+        rate = lease.get('escrow_payment', _EMPTY).get('rate')
+        if isinstance(rate, dict):
+            return int(rate.get('amount', 0))
+        if isinstance(rate, str):
+            return int(rate)
+        return 0
+
     def process_lease_costs(self, leases: List[Dict]) -> List[Dict]:
         """Process lease data to extract cost information"""
-        processed_costs = []
+        valid_leases = []
+        amounts = []
 
+        # Pull every per-lease field here, so a malformed lease is skipped
+        # before it reaches the batch conversion below
         for lease in leases:
             try:
-                lease_data = lease.get('lease', {})
-                lease_id = lease_data.get('lease_id', {})
-
-                # Extract price from lease
-                price_info = lease.get('escrow_payment', {})
-
-                # Price is typically in the format of amount per block
-                amount_uakt = 0
-                if 'rate' in price_info:
-                    rate = price_info['rate']
-                    if isinstance(rate, dict):
-                        amount_uakt = int(rate.get('amount', 0))
-                    elif isinstance(rate, str):
-                        amount_uakt = int(rate)
-
-                # Calculate costs
-                usd_per_block = calculate_cost(amount_uakt, self.akt_price)
-
-                # Akash blocks are ~6 seconds, so ~14,400 blocks per day
-                blocks_per_day = 14400
-                blocks_per_month = blocks_per_day * 30
-
-                daily_cost_usd = usd_per_block * blocks_per_day
-                monthly_cost_usd = usd_per_block * blocks_per_month
-
-                cost_data = {
-                    'timestamp': datetime.now().isoformat(),
-                    'deployment_id': {
-                        'owner': lease_id.get('owner', ''),
-                        'dseq': lease_id.get('dseq', ''),
-                    },
-                    'lease_id': {
-                        'owner': lease_id.get('owner', ''),
-                        'dseq': lease_id.get('dseq', ''),
-                        'gseq': lease_id.get('gseq', ''),
-                        'oseq': lease_id.get('oseq', ''),
-                        'provider': lease_id.get('provider', ''),
-                    },
-                    'pricing': {
-                        'amount_uakt_per_block': amount_uakt,
-                        'akt_per_block': amount_uakt / 1_000_000,
-                        'usd_per_block': usd_per_block,
-                        'daily_cost_usd': daily_cost_usd,
-                        'monthly_cost_usd': monthly_cost_usd,
-                        'akt_usd_rate': self.akt_price,
-                    },
-                    'state': lease_data.get('state', ''),
-                    'created_at': lease_data.get('created_at', ''),
-                }
-
-                processed_costs.append(cost_data)
-
+                amount = self._lease_amount_uakt(lease)
+                lease_data = lease.get('lease', _EMPTY)
+                lease_id = lease_data.get('lease_id', _EMPTY)
+                valid_leases.append((
+                    lease_id.get('owner', ''),
+                    lease_id.get('dseq', ''),
+                    lease_id.get('gseq', ''),
+                    lease_id.get('oseq', ''),
+                    lease_id.get('provider', ''),
+                    lease_data.get('state', ''),
+                    lease_data.get('created_at', ''),
+                ))
+                amounts.append(amount)
             except Exception as e:
                 logger.warning(f"Error processing lease: {e}")
                 continue
 
+        # Convert every lease price at once (1 AKT = 1,000,000 uAKT)
+        amount_uakt = np.array(amounts, dtype=np.int64)
+        akt_per_block = amount_uakt / 1_000_000
+        usd_per_block = calculate_cost_batch(amount_uakt, self.akt_price)
+        daily_cost_usd = usd_per_block * self.BLOCKS_PER_DAY
+        monthly_cost_usd = usd_per_block * self.BLOCKS_PER_MONTH
+
+        # One collection timestamp for the whole batch
+        timestamp = datetime.now().isoformat()
+        akt_usd_rate = self.akt_price
+
+        processed_costs = []
+        for fields, amount, akt, usd, daily, monthly in zip(
+            valid_leases,
+            amount_uakt.tolist(),
+            akt_per_block.tolist(),
+            usd_per_block.tolist(),
+            daily_cost_usd.tolist(),
+            monthly_cost_usd.tolist(),
+        ):
+            owner, dseq, gseq, oseq, provider, state, created_at = fields
+
+            processed_costs.append({
+                'timestamp': timestamp,
+                'deployment_id': {
+                    'owner': owner,
+                    'dseq': dseq,
+                },
+                'lease_id': {
+                    'owner': owner,
+                    'dseq': dseq,
+                    'gseq': gseq,
+                    'oseq': oseq,
+                    'provider': provider,
+                },
+                'pricing': {
+                    'amount_uakt_per_block': amount,
+                    'akt_per_block': akt,
+                    'usd_per_block': usd,
+                    'daily_cost_usd': daily,
+                    'monthly_cost_usd': monthly,
+                    'akt_usd_rate': akt_usd_rate,
+                },
+                'state': state,
+                'created_at': created_at,
+            })
+
         logger.info(f"Processed {len(processed_costs)} lease costs")
         return processed_costs
 
@@ -133,24 +175,38 @@ class DeploymentCostCollector:
         if not costs:
             return {}
 
-        total_daily = sum(c['pricing']['daily_cost_usd'] for c in costs)
-        total_monthly = sum(c['pricing']['monthly_cost_usd'] for c in costs)
-        avg_daily = total_daily / len(costs) if costs else 0
-        avg_monthly = total_monthly / len(costs) if costs else 0
-
-        # Group by provider
-        provider_stats = {}
+        # Pull every field the stats need in one pass over the records
+        daily_costs = []
+        monthly_costs = []
+        providers = []
         for cost in costs:
-            provider = cost['lease_id']['provider']
-            if provider not in provider_stats:
-                provider_stats[provider] = {
-                    'lease_count': 0,
-                    'total_daily_usd': 0,
-                    'total_monthly_usd': 0,
-                }
-            provider_stats[provider]['lease_count'] += 1
-            provider_stats[provider]['total_daily_usd'] += cost['pricing']['daily_cost_usd']
-            provider_stats[provider]['total_monthly_usd'] += cost['pricing']['monthly_cost_usd']
+            pricing = cost['pricing']
+            daily_costs.append(pricing['daily_cost_usd'])
+            monthly_costs.append(pricing['monthly_cost_usd'])
+            providers.append(cost['lease_id']['provider'])
+
+        daily = np.array(daily_costs, dtype=np.float64)
+        monthly = np.array(monthly_costs, dtype=np.float64)
+
+        total_daily = float(daily.sum())
+        total_monthly = float(monthly.sum())
+        avg_daily = total_daily / len(costs)
+        avg_monthly = total_monthly / len(costs)
+
+        # Group by provider: factorize keeps first-seen order, bincount sums per group
+        codes, unique_providers = pd.factorize(np.array(providers, dtype=object), use_na_sentinel=False)
+        lease_counts = np.bincount(codes).tolist()
+        daily_by_provider = np.bincount(codes, weights=daily).tolist()
+        monthly_by_provider = np.bincount(codes, weights=monthly).tolist()
+
+        provider_stats = {
+            provider: {
+                'lease_count': lease_counts[i],
+                'total_daily_usd': daily_by_provider[i],
+                'total_monthly_usd': monthly_by_provider[i],
+            }
+            for i, provider in enumerate(unique_providers.tolist())
+        }
 
         return {
             'timestamp': datetime.now().isoformat(),
@@ -169,11 +225,7 @@ class DeploymentCostCollector:
         """Run the cost collection process"""
         console.print("\n[bold blue]Akash Network - Deployment Cost Collector[/bold blue]\n")
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
+        with progress_spinner(console) as progress:
 
             # Collect leases
             task1 = progress.add_task("Collecting leases...", total=None)
@@ -204,13 +256,17 @@ class DeploymentCostCollector:
         console.print(f"Average Daily Cost per Lease: [cyan]${stats['aggregate_costs']['average_daily_usd']:.2f}[/cyan]")
         console.print(f"Current AKT Price: [cyan]${self.akt_price:.2f}[/cyan]\n")
 
+        # The snapshots were written in the background while the summary was shown
+        self.storage.flush()
+
         return stats
 
 
 @click.command()
 @click.option('--config', default='config.yaml', help='Path to configuration file')
 @click.option('--verbose', is_flag=True, help='Enable verbose logging')
-def main(config, verbose):
+@click.option('--no-cache', is_flag=True, help='Ignore the API response cache and fetch fresh data')
+def main(config, verbose, no_cache):
     """Collect deployment cost data from Akash Network"""
 
     # Load configuration
@@ -218,9 +274,13 @@ def main(config, verbose):
 
     # Setup logging
     if verbose:
-        cfg.config['logging']['level'] = 'DEBUG'
+        cfg.set('logging', 'level', value='DEBUG')
     setup_logging(cfg)
 
+    if no_cache and cfg.get('akash', 'page_cache'):
+        cfg.set('akash', 'page_cache', 'enabled', value=False)
+        cfg.set('akash', 'page_cache', 'shared_ttl', value=0)
+
     # Run collector
     collector = DeploymentCostCollector(cfg)
     collector.run()
@@ -13,22 +13,40 @@ Since the public API doesn't provide lease pricing data, we estimate costs using
 
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional
 import click
+import numpy as np
 from loguru import logger
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from utils import Config, AkashAPIClient, DataStorage, setup_logging
+from utils import Config, AkashAPIClient, DataStorage, progress_spinner, setup_logging
 
 console = Console()
 
+# Shared read-only default for missing nested objects
+_EMPTY: Dict = {}
+
+# Bytes per GB in the pricing benchmarks
+_GIB = 1024 ** 3
+
+# Numeric fields reduced by NetworkStatsAccumulator
+_STATS_DTYPE = np.dtype([
+    ('monthly', 'f8'),
+    ('daily', 'f8'),
+    ('cpu', 'i8'),
+    ('memory', 'i8'),
+    ('storage', 'i8'),
+    ('gpu', 'i8'),
+])
+_COST_BUCKET_EDGES = [10, 50, 100]
+
 
 class PricingEstimator:
     """Estimates deployment costs based on resource specifications"""
@@ -54,6 +72,16 @@ class PricingEstimator:
         }
     }
 
+    # Benchmark rates unpacked once so the per-deployment math reads no dicts
+    CPU_PER_CORE = PRICING_BENCHMARKS['cpu_per_core']
+    MEMORY_PER_GB = PRICING_BENCHMARKS['memory_per_gb']
+    STORAGE_PER_GB = PRICING_BENCHMARKS['storage_per_gb']
+    GPU_PER_UNIT = PRICING_BENCHMARKS['gpu_per_unit']
+
+    # GPU multipliers with the fallback resolved once, rather than on every lookup
+    GPU_MULTIPLIERS = PRICING_BENCHMARKS['gpu_models']
+    DEFAULT_GPU_MULTIPLIER = GPU_MULTIPLIERS['default']
+
     @classmethod
     def estimate_deployment_cost(cls, deployment: Dict) -> Dict:
         """
@@ -66,35 +94,7 @@ class PricingEstimator:
             Dict with pricing estimates and breakdown
         """
         try:
-            resources = cls._extract_resources(deployment)
-
-            # Calculate component costs
-            cpu_cost = cls._calculate_cpu_cost(resources.get('cpu', 0))
-            memory_cost = cls._calculate_memory_cost(resources.get('memory', 0))
-            storage_cost = cls._calculate_storage_cost(resources.get('storage', 0))
-            gpu_cost = cls._calculate_gpu_cost(
-                resources.get('gpu', 0),
-                resources.get('gpu_model', 'default')
-            )
-
-            # Total monthly cost
-            total_monthly = cpu_cost + memory_cost + storage_cost + gpu_cost
-            total_daily = total_monthly / 30
-            total_hourly = total_monthly / 730  # ~730 hours per month
-
-            return {
-                'total_monthly_usd': round(total_monthly, 2),
-                'total_daily_usd': round(total_daily, 2),
-                'total_hourly_usd': round(total_hourly, 4),
-                'breakdown': {
-                    'cpu_monthly_usd': round(cpu_cost, 2),
-                    'memory_monthly_usd': round(memory_cost, 2),
-                    'storage_monthly_usd': round(storage_cost, 2),
-                    'gpu_monthly_usd': round(gpu_cost, 2),
-                },
-                'resources': resources,
-                'estimation_method': 'resource_based_benchmark'
-            }
+            return cls.estimate_costs([deployment])[0]
         except Exception as e:
             logger.warning(f"Error estimating cost: {e}")
             return {
@@ -107,96 +107,180 @@ class PricingEstimator:
                 'error': str(e)
             }
 
+    @classmethod
+    def estimate_costs(cls, deployments: List[Dict]) -> List[Dict]:
+        """Estimate monthly costs for a batch of deployments with vectorized cost math"""
+        resources = [cls._extract_resources(deployment) for deployment in deployments]
+        if not resources:
+            return []
+
+        # One column per cost component
+        get_multiplier = cls.GPU_MULTIPLIERS.get
+        default_multiplier = cls.DEFAULT_GPU_MULTIPLIER
+        units = np.array(
+            [(r['cpu'], r['memory'], r['storage'], r['gpu'], get_multiplier(r['gpu_model'], default_multiplier))
+             for r in resources],
+            dtype=np.float64,
+        )
+        cpu_cost = units[:, 0] / 1000 * cls.CPU_PER_CORE
+        memory_cost = units[:, 1] / _GIB * cls.MEMORY_PER_GB
+        storage_cost = units[:, 2] / _GIB * cls.STORAGE_PER_GB
+        gpu_cost = units[:, 3] * cls.GPU_PER_UNIT * units[:, 4]
+        total_monthly = cpu_cost + memory_cost + storage_cost + gpu_cost
+
+        estimates = []
+        for r, cpu, memory, storage, gpu, monthly in zip(
+                resources, cpu_cost.tolist(), memory_cost.tolist(), storage_cost.tolist(),
+                gpu_cost.tolist(), total_monthly.tolist()):
+            estimates.append({
+                'total_monthly_usd': round(monthly, 2),
+                'total_daily_usd': round(monthly / 30, 2),
+                'total_hourly_usd': round(monthly / 730, 4),
+                'breakdown': {
+                    'cpu_monthly_usd': round(cpu, 2),
+                    'memory_monthly_usd': round(memory, 2),
+                    'storage_monthly_usd': round(storage, 2),
+                    'gpu_monthly_usd': round(gpu, 2) if r['gpu'] else 0,
+                },
+                'resources': r,
+                'estimation_method': 'resource_based_benchmark'
+            })
+        return estimates
+
     @classmethod
     def _extract_resources(cls, deployment: Dict) -> Dict:
         """Extract resource specifications from deployment data"""
-        resources = {
-            'cpu': 0,
-            'memory': 0,
-            'storage': 0,
-            'gpu': 0,
-            'gpu_model': 'default'
-        }
+        cpu = memory = storage = gpu = 0
+        gpu_model = 'default'
 
         try:
-            groups = deployment.get('groups', [])
-            for group in groups:
-                group_spec = group.get('group_spec', {})
-                resource_list = group_spec.get('resources', [])
-
-                for resource_item in resource_list:
-                    resource = resource_item.get('resource', {})
+            for group in deployment.get('groups', ()):
+                for resource_item in group.get('group_spec', _EMPTY).get('resources', ()):
+                    resource = resource_item.get('resource', _EMPTY)
                     count = int(resource_item.get('count', 1))
 
                     # CPU (in millicores)
-                    cpu = resource.get('cpu', {})
-                    cpu_units = cpu.get('units', {})
-                    cpu_val = int(cpu_units.get('val', 0))
-                    resources['cpu'] += cpu_val * count
+                    cpu += int(resource.get('cpu', _EMPTY).get('units', _EMPTY).get('val', 0)) * count
 
                     # Memory (in bytes)
-                    memory = resource.get('memory', {})
-                    memory_quantity = memory.get('quantity', {})
-                    memory_val = int(memory_quantity.get('val', 0))
-                    resources['memory'] += memory_val * count
+                    memory += int(resource.get('memory', _EMPTY).get('quantity', _EMPTY).get('val', 0)) * count
 
                     # Storage (in bytes)
-                    storage_items = resource.get('storage', [])
-                    for storage in storage_items:
-                        storage_quantity = storage.get('quantity', {})
-                        storage_val = int(storage_quantity.get('val', 0))
-                        resources['storage'] += storage_val * count
+                    for storage_item in resource.get('storage', ()):
+                        storage += int(storage_item.get('quantity', _EMPTY).get('val', 0)) * count
 
                     # GPU
-                    gpu = resource.get('gpu', {})
-                    gpu_units = gpu.get('units', {})
-                    gpu_val = int(gpu_units.get('val', 0))
-                    resources['gpu'] += gpu_val * count
+                    gpu_spec = resource.get('gpu', _EMPTY)
+                    gpu += int(gpu_spec.get('units', _EMPTY).get('val', 0)) * count
 
                     # GPU model from attributes
-                    gpu_attrs = gpu.get('attributes', [])
-                    for attr in gpu_attrs:
+                    for attr in gpu_spec.get('attributes', ()):
                         if attr.get('key') == 'vendor/nvidia/model':
-                            resources['gpu_model'] = attr.get('value', 'default').lower()
-
-            return resources
+                            gpu_model = attr.get('value', 'default').lower()
 
         except Exception as e:
             logger.error(f"Error extracting resources: {e}")
-            return resources
 
-    @classmethod
-    def _calculate_cpu_cost(cls, cpu_millicores: int) -> float:
-        """Calculate CPU cost from millicores"""
-        cores = cpu_millicores / 1000
-        return cores * cls.PRICING_BENCHMARKS['cpu_per_core']
+        return {
+            'cpu': cpu,
+            'memory': memory,
+            'storage': storage,
+            'gpu': gpu,
+            'gpu_model': gpu_model
+        }
 
-    @classmethod
-    def _calculate_memory_cost(cls, memory_bytes: int) -> float:
-        """Calculate memory cost from bytes"""
-        memory_gb = memory_bytes / (1024 ** 3)
-        return memory_gb * cls.PRICING_BENCHMARKS['memory_per_gb']
 
-    @classmethod
-    def _calculate_storage_cost(cls, storage_bytes: int) -> float:
-        """Calculate storage cost from bytes"""
-        storage_gb = storage_bytes / (1024 ** 3)
-        # Assuming ephemeral storage (most common)
-        return storage_gb * cls.PRICING_BENCHMARKS['storage_per_gb']
+class NetworkStatsAccumulator:
+    """Running network statistics over batches of processed deployments"""
 
-    @classmethod
-    def _calculate_gpu_cost(cls, gpu_count: int, gpu_model: str = 'default') -> float:
-        """Calculate GPU cost based on count and model"""
-        if gpu_count == 0:
-            return 0
-
-        base_cost = cls.PRICING_BENCHMARKS['gpu_per_unit']
-        model_multiplier = cls.PRICING_BENCHMARKS['gpu_models'].get(
-            gpu_model.lower(),
-            cls.PRICING_BENCHMARKS['gpu_models']['default']
-        )
+    def __init__(self):
+        self.count = 0
+        self.total_monthly = 0.0
+        self.total_daily = 0.0
+        self.total_cpu = self.total_memory = self.total_storage = self.total_gpu = 0
+        # Deployments per monthly cost bucket: < $10, $10-50, $50-100 and >= $100
+        self.cost_buckets = np.zeros(len(_COST_BUCKET_EDGES) + 1, dtype=np.int64)
+        self.owners = set()
+        self.providers = set()
 
-        return gpu_count * base_cost * model_multiplier
+    def add(self, deployments: List[Dict]):
+        """Fold a batch of processed deployments into the totals"""
+        if not deployments:
+            return
+
+        # Owners and providers are strings, so they are collected while the numeric
+        # fields are streamed into a structured array for the reductions below
+        add_owner = self.owners.add
+        add_providers = self.providers.update
+
+        def rows():
+            for d in deployments:
+                add_owner(d['deployment_id']['owner'])
+                add_providers(d.get('providers', ()))
+
+                estimate = d['pricing_estimate']
+                resources = estimate['resources']
+                yield (
+                    estimate['total_monthly_usd'],
+                    estimate['total_daily_usd'],
+                    resources.get('cpu', 0),
+                    resources.get('memory', 0),
+                    resources.get('storage', 0),
+                    resources.get('gpu', 0),
+                )
+
+        stats = np.fromiter(rows(), dtype=_STATS_DTYPE, count=len(deployments))
+        monthly = stats['monthly']
+
+        self.count += len(deployments)
+        self.total_monthly += float(monthly.sum())
+        self.total_daily += float(stats['daily'].sum())
+        self.total_cpu += int(stats['cpu'].sum())
+        self.total_memory += int(stats['memory'].sum())
+        self.total_storage += int(stats['storage'].sum())
+        self.total_gpu += int(stats['gpu'].sum())
+        self.cost_buckets += np.bincount(np.digitize(monthly, _COST_BUCKET_EDGES), minlength=len(self.cost_buckets))
+
+    def result(self) -> Dict:
+        """Return the network statistics for everything added so far"""
+        if not self.count:
+            return {
+                'total_active_deployments': 0,
+                'total_estimated_monthly_cost_usd': 0,
+                'total_estimated_daily_cost_usd': 0,
+                'average_deployment_cost_monthly_usd': 0,
+                'unique_owners': 0,
+                'unique_providers': 0,
+                'resource_totals': {},
+                'cost_distribution': {}
+            }
+
+        under_10, from_10_to_50, from_50_to_100, over_100 = self.cost_buckets.tolist()
+        return {
+            'timestamp': datetime.now().isoformat(),
+            'total_active_deployments': self.count,
+            'total_estimated_monthly_cost_usd': round(self.total_monthly, 2),
+            'total_estimated_daily_cost_usd': round(self.total_daily, 2),
+            'average_deployment_cost_monthly_usd': round(self.total_monthly / self.count, 2),
+            'unique_owners': len(self.owners),
+            'unique_providers': len(self.providers),
+            'resource_totals': {
+                'total_cpu_millicores': self.total_cpu,
+                'total_cpu_cores': round(self.total_cpu / 1000, 2),
+                'total_memory_bytes': self.total_memory,
+                'total_memory_gb': round(self.total_memory / _GIB, 2),
+                'total_storage_bytes': self.total_storage,
+                'total_storage_gb': round(self.total_storage / _GIB, 2),
+                'total_gpu_units': self.total_gpu
+            },
+            'cost_distribution': {
+                'deployments_under_10_usd': under_10,
+                'deployments_10_to_50_usd': from_10_to_50,
+                'deployments_50_to_100_usd': from_50_to_100,
+                'deployments_over_100_usd': over_100,
+            },
+            'disclaimer': 'All costs are estimates based on resource specifications and market pricing benchmarks. Actual costs may vary based on provider pricing and market conditions.'
+        }
 
 
 class RealDeploymentCollector:
@@ -207,6 +291,7 @@ class RealDeploymentCollector:
         self.api_client = AkashAPIClient(config)
         self.storage = DataStorage(config)
         self.estimator = PricingEstimator()
+        self.process_workers = config.get('collection', 'process_workers', default=1)
 
     def collect_deployments(self) -> List[Dict]:
         """Collect active deployments from Akash Network"""
@@ -221,32 +306,48 @@ class RealDeploymentCollector:
         logger.info(f"Collected {len(deployments)} deployments")
         return deployments
 
+    def estimate_costs(self, deployments: List[Dict]) -> List[Dict]:
+        """Estimate costs for a batch of deployments, across processes if configured"""
+        estimate = self.estimator.estimate_costs
+        if self.process_workers > 1 and len(deployments) > self.process_workers:
+            chunksize = -(-len(deployments) // (self.process_workers * 4))
+            chunks = [deployments[i:i + chunksize] for i in range(0, len(deployments), chunksize)]
+            with ProcessPoolExecutor(max_workers=self.process_workers) as executor:
+                return [pricing for chunk in executor.map(estimate, chunks) for pricing in chunk]
+        return estimate(deployments)
+
     def process_deployments(self, deployments: List[Dict]) -> List[Dict]:
         """Process deployments and add cost estimations"""
-        processed = []
-
+        # Skip if not active
+        active = []
         for deployment in deployments:
             try:
-                deployment_data = deployment.get('deployment', {})
-                deployment_id = deployment_data.get('id', {})
+                if deployment.get('deployment', _EMPTY).get('state') == 'active':
+                    active.append(deployment)
+            except Exception as e:
+                logger.warning(f"Error processing deployment: {e}")
 
-                # Skip if not active
-                if deployment_data.get('state') != 'active':
-                    continue
+        # Estimate costs
+        pricings = self.estimate_costs(active)
 
-                # Estimate costs
-                pricing = self.estimator.estimate_deployment_cost(deployment)
+        processed = []
+        # One collection timestamp for the whole batch
+        timestamp = datetime.now().isoformat()
+
+        for deployment, pricing in zip(active, pricings):
+            try:
+                deployment_data = deployment['deployment']
+                deployment_id = deployment_data.get('id', _EMPTY)
 
                 # Extract provider info from groups
-                providers = set()
-                groups = deployment.get('groups', [])
-                for group in groups:
-                    group_id = group.get('id', {})
-                    if 'provider' in group_id:
-                        providers.add(group_id.get('provider'))
+                providers = {
+                    group_id['provider']
+                    for group in deployment.get('groups', ())
+                    if 'provider' in (group_id := group.get('id', _EMPTY))
+                }
 
                 processed_deployment = {
-                    'timestamp': datetime.now().isoformat(),
+                    'timestamp': timestamp,
                     'deployment_id': {
                         'owner': deployment_id.get('owner', ''),
                         'dseq': str(deployment_id.get('dseq', '')),
@@ -257,7 +358,7 @@ class RealDeploymentCollector:
                     'pricing_estimate': pricing,
                     'metadata': {
                         'data_source': 'akash_public_api',
-                        'collection_timestamp': datetime.now().isoformat(),
+                        'collection_timestamp': timestamp,
                         'is_estimate': True,
                         'estimation_disclaimer': 'Costs are estimated based on resource specifications and market benchmarks. Actual costs may vary.'
                     }
@@ -274,90 +375,49 @@ class RealDeploymentCollector:
 
     def calculate_aggregate_stats(self, deployments: List[Dict]) -> Dict:
         """Calculate aggregate statistics"""
-        if not deployments:
-            return {
-                'total_active_deployments': 0,
-                'total_estimated_monthly_cost_usd': 0,
-                'total_estimated_daily_cost_usd': 0,
-                'average_deployment_cost_monthly_usd': 0,
-                'unique_owners': 0,
-                'unique_providers': 0,
-                'resource_totals': {},
-                'cost_distribution': {}
-            }
-
-        total_monthly = sum(d['pricing_estimate']['total_monthly_usd'] for d in deployments)
-        total_daily = sum(d['pricing_estimate']['total_daily_usd'] for d in deployments)
-        unique_owners = len(set(d['deployment_id']['owner'] for d in deployments))
+        stats = NetworkStatsAccumulator()
+        stats.add(deployments)
+        return stats.result()
 
-        # Collect all providers
-        all_providers = set()
-        for d in deployments:
-            all_providers.update(d.get('providers', []))
+    def iter_deployment_batches(self, batch_size: int) -> Iterator[List[Dict]]:
+        """Yield raw deployments in batches of about batch_size as their pages arrive"""
+        endpoint = self.config.get('akash', 'endpoints', 'deployments',
+                                   default='/akash/deployment/v1beta4/deployments/list')
+        page_size = self.config.get('collection', 'page_size', default=100)
 
-        # Resource totals
-        total_cpu = sum(d['pricing_estimate']['resources'].get('cpu', 0) for d in deployments)
-        total_memory = sum(d['pricing_estimate']['resources'].get('memory', 0) for d in deployments)
-        total_storage = sum(d['pricing_estimate']['resources'].get('storage', 0) for d in deployments)
-        total_gpu = sum(d['pricing_estimate']['resources'].get('gpu', 0) for d in deployments)
-
-        return {
-            'timestamp': datetime.now().isoformat(),
-            'total_active_deployments': len(deployments),
-            'total_estimated_monthly_cost_usd': round(total_monthly, 2),
-            'total_estimated_daily_cost_usd': round(total_daily, 2),
-            'average_deployment_cost_monthly_usd': round(total_monthly / len(deployments), 2) if deployments else 0,
-            'unique_owners': unique_owners,
-            'unique_providers': len(all_providers),
-            'resource_totals': {
-                'total_cpu_millicores': total_cpu,
-                'total_cpu_cores': round(total_cpu / 1000, 2),
-                'total_memory_bytes': total_memory,
-                'total_memory_gb': round(total_memory / (1024 ** 3), 2),
-                'total_storage_bytes': total_storage,
-                'total_storage_gb': round(total_storage / (1024 ** 3), 2),
-                'total_gpu_units': total_gpu
-            },
-            'cost_distribution': {
-                'deployments_under_10_usd': len([d for d in deployments if d['pricing_estimate']['total_monthly_usd'] < 10]),
-                'deployments_10_to_50_usd': len([d for d in deployments if 10 <= d['pricing_estimate']['total_monthly_usd'] < 50]),
-                'deployments_50_to_100_usd': len([d for d in deployments if 50 <= d['pricing_estimate']['total_monthly_usd'] < 100]),
-                'deployments_over_100_usd': len([d for d in deployments if d['pricing_estimate']['total_monthly_usd'] >= 100]),
-            },
-            'disclaimer': 'All costs are estimates based on resource specifications and market pricing benchmarks. Actual costs may vary based on provider pricing and market conditions.'
-        }
+        batch = []
+        for page in self.api_client.iter_pages(endpoint, page_size):
+            batch.extend(page)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
 
     def run(self):
         """Run the collection process"""
         console.print("\n[bold blue]Akash Network - Real Deployment Collector (with Cost Estimation)[/bold blue]\n")
         console.print("[yellow]Note: Costs are estimated based on resource specs and market benchmarks[/yellow]\n")
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-
-            # Collect deployments
-            task1 = progress.add_task("Collecting deployments from blockchain...", total=None)
-            deployments = self.collect_deployments()
+        with progress_spinner(console) as progress:
+
+            # Collect deployments, estimate costs and save them a batch at a time,
+            # so neither the raw nor the processed deployments are all held in memory
+            task1 = progress.add_task("Collecting deployments and estimating costs...", total=None)
+            accumulator = NetworkStatsAccumulator()
+            batch_size = self.config.get('collection', 'batch_size', default=5000)
+            with self.storage.open_stream('real_deployments') as writer:
+                for batch in self.iter_deployment_batches(batch_size):
+                    processed = self.process_deployments(batch)
+                    writer.write_many(processed)
+                    accumulator.add(processed)
             progress.update(task1, completed=True)
 
-            # Process and estimate costs
-            task2 = progress.add_task("Estimating costs based on resources...", total=None)
-            processed = self.process_deployments(deployments)
-            progress.update(task2, completed=True)
-
             # Calculate statistics
-            task3 = progress.add_task("Calculating network statistics...", total=None)
-            stats = self.calculate_aggregate_stats(processed)
-            progress.update(task3, completed=True)
-
-            # Save data
-            task4 = progress.add_task("Saving data...", total=None)
-            self.storage.save(processed, 'real_deployments')
+            task2 = progress.add_task("Calculating network statistics...", total=None)
+            stats = accumulator.result()
             self.storage.save(stats, 'network_statistics')
-            progress.update(task4, completed=True)
+            progress.update(task2, completed=True)
 
         # Display summary table
         console.print("\n[bold green]Collection Complete![/bold green]\n")
@@ -381,13 +441,17 @@ class RealDeploymentCollector:
         console.print(f"\n[dim]Data saved to: {self.storage.config.get('storage', 'directory', default='collected_data')}[/dim]")
         console.print("[dim yellow]⚠️  Costs are estimates only - actual provider pricing may vary[/dim yellow]\n")
 
+        # The snapshots were written in the background while the summary was shown
+        self.storage.flush()
+
         return stats
 
 
 @click.command()
 @click.option('--config', default='config.yaml', help='Path to configuration file')
 @click.option('--verbose', is_flag=True, help='Enable verbose logging')
-def main(config, verbose):
+@click.option('--no-cache', is_flag=True, help='Ignore the API response cache and fetch fresh data')
+def main(config, verbose, no_cache):
     """Collect real deployment data from Akash Network with cost estimation"""
 
     # Load configuration
@@ -395,9 +459,13 @@ def main(config, verbose):
 
     # Setup logging
     if verbose:
-        cfg.config['logging']['level'] = 'DEBUG'
+        cfg.set('logging', 'level', value='DEBUG')
     setup_logging(cfg)
 
+    if no_cache and cfg.get('akash', 'page_cache'):
+        cfg.set('akash', 'page_cache', 'enabled', value=False)
+        cfg.set('akash', 'page_cache', 'shared_ttl', value=0)
+
     # Run collector
     collector = RealDeploymentCollector(cfg)
     collector.run()
@@ -8,11 +8,11 @@ including CPU, GPU, memory, and storage usage from active leases and provider ca
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Set, Tuple
 import click
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
 # Add parent directory to path to import utils
@@ -22,12 +22,19 @@ from utils import (
     Config,
     AkashAPIClient,
     DataStorage,
-    setup_logging
+    setup_logging,
+    progress_spinner
 )
 from loguru import logger
 
 console = Console()
 
+# Shared read-only default for missing nested objects
+_EMPTY: Dict = {}
+
+# Bytes per GB
+_GIB = 1024 ** 3
+
 
 class ResourceUsageCollector:
     """Collects resource usage data from Akash Network"""
@@ -70,51 +77,47 @@ class ResourceUsageCollector:
             'storage': 0,
         }
 
+        if not isinstance(resources, list):
+            return resource_data
+
+        # Specs are usually complete, so index directly and treat a missing or
+        # null field as zero instead of guarding every level with .get()
         try:
-            if isinstance(resources, list):
-                for resource_group in resources:
-                    resources_obj = resource_group.get('resources', {})
-
-                    # CPU (in millicores, 1000 = 1 CPU)
-                    cpu = resources_obj.get('cpu', {})
-                    if cpu:
-                        units = cpu.get('units', {})
-                        if units:
-                            val = units.get('val', '0')
-                            resource_data['cpu'] += int(val) / 1000
-
-                    # GPU
-                    gpu = resources_obj.get('gpu', {})
-                    if gpu:
-                        units = gpu.get('units', {})
-                        if units:
-                            val = units.get('val', '0')
-                            resource_data['gpu'] += int(val)
-
-                    # Memory (in bytes)
-                    memory = resources_obj.get('memory', {})
-                    if memory:
-                        quantity = memory.get('quantity', {})
-                        if quantity:
-                            val = quantity.get('val', '0')
-                            # Convert to GB
-                            resource_data['memory'] += int(val) / (1024 ** 3)
-
-                    # Storage (in bytes)
-                    storage = resources_obj.get('storage', [])
-                    for storage_item in storage:
-                        quantity = storage_item.get('quantity', {})
-                        if quantity:
-                            val = quantity.get('val', '0')
-                            # Convert to GB
-                            resource_data['storage'] += int(val) / (1024 ** 3)
+            for resource_group in resources:
+                resources_obj = resource_group.get('resources', _EMPTY)
+
+                # CPU (in millicores, 1000 = 1 CPU)
+                try:
+                    resource_data['cpu'] += int(resources_obj['cpu']['units']['val']) / 1000
+                except (KeyError, TypeError):
+                    pass
+
+                # GPU
+                try:
+                    resource_data['gpu'] += int(resources_obj['gpu']['units']['val'])
+                except (KeyError, TypeError):
+                    pass
+
+                # Memory (in bytes, converted to GB)
+                try:
+                    resource_data['memory'] += int(resources_obj['memory']['quantity']['val']) / _GIB
+                except (KeyError, TypeError):
+                    pass
+
+                # Storage (in bytes, converted to GB)
+                for storage_item in resources_obj.get('storage', ()):
+                    try:
+                        resource_data['storage'] += int(storage_item['quantity']['val']) / _GIB
+                    except (KeyError, TypeError):
+                        pass
 
         except Exception as e:
             logger.warning(f"Error parsing resource spec: {e}")
 
         return resource_data
 
-    def analyze_lease_resources(self, leases: List[Dict]) -> Tuple[List[Dict], Dict]:
+    def analyze_lease_resources(self, leases: List[Dict],
+                                timestamp: Optional[str] = None) -> Tuple[List[Dict], Dict]:
         """Analyze resource usage from leases"""
         lease_resources = []
         total_resources = {
@@ -123,6 +126,8 @@ class ResourceUsageCollector:
             'memory': 0,
             'storage': 0,
         }
+        # One collection timestamp for the whole batch
+        timestamp = timestamp or datetime.now().isoformat()
 
         for lease in leases:
             try:
@@ -132,7 +137,7 @@ class ResourceUsageCollector:
                 # Note: Actual resource specs would need to be fetched from the deployment
                 # For now, we're collecting lease IDs and provider associations
                 lease_info = {
-                    'timestamp': datetime.now().isoformat(),
+                    'timestamp': timestamp,
                     'lease_id': {
                         'owner': lease_id.get('owner', ''),
                         'dseq': lease_id.get('dseq', ''),
@@ -153,24 +158,23 @@ class ResourceUsageCollector:
         logger.info(f"Analyzed {len(lease_resources)} lease resources")
         return lease_resources, total_resources
 
-    def analyze_provider_capacity(self, providers: List[Dict]) -> List[Dict]:
+    def analyze_provider_capacity(self, providers: List[Dict], timestamp: Optional[str] = None) -> List[Dict]:
         """Analyze provider capacity and attributes"""
         provider_data = []
+        timestamp = timestamp or datetime.now().isoformat()
 
         for provider in providers:
             try:
-                provider_info = provider.get('provider', {})
-                attributes = provider.get('attributes', [])
+                provider_info = provider.get('provider', _EMPTY)
 
                 # Parse provider attributes
-                attr_dict = {}
-                for attr in attributes:
-                    key = attr.get('key', '')
-                    value = attr.get('value', '')
-                    attr_dict[key] = value
+                attr_dict = {
+                    attr.get('key', ''): attr.get('value', '')
+                    for attr in provider.get('attributes', ())
+                }
 
                 provider_record = {
-                    'timestamp': datetime.now().isoformat(),
+                    'timestamp': timestamp,
                     'address': provider_info.get('owner', ''),
                     'host_uri': provider_info.get('host_uri', ''),
                     'attributes': attr_dict,
@@ -188,10 +192,27 @@ class ResourceUsageCollector:
 
     def calculate_network_statistics(self, leases: List[Dict], providers: List[Dict]) -> Dict:
         """Calculate network-wide resource statistics"""
+        return self._network_statistics(len(leases), len(providers), self._lease_providers(leases))
+
+    @staticmethod
+    def _lease_provider(lease: Dict) -> Optional[str]:
+        """Provider of a lease, or None when the lease is malformed"""
+        try:
+            return lease.get('lease', _EMPTY).get('lease_id', _EMPTY).get('provider')
+        except AttributeError:
+            return None
+
+    @classmethod
+    def _lease_providers(cls, leases: List[Dict]) -> Set[str]:
+        """Distinct providers serving the given leases"""
+        return {provider for lease in leases if (provider := cls._lease_provider(lease))}
+
+    def _network_statistics(self, lease_count: int, provider_count: int, providers_with_leases: Set[str]) -> Dict:
+        """Build the network statistics from lease and provider totals"""
         stats = {
             'timestamp': datetime.now().isoformat(),
-            'active_leases': len(leases),
-            'active_providers': len(providers),
+            'active_leases': lease_count,
+            'active_providers': provider_count,
             'resources': {
                 'total_cpu_cores': 0,
                 'total_gpu_units': 0,
@@ -199,23 +220,11 @@ class ResourceUsageCollector:
                 'total_storage_gb': 0,
             },
             'provider_distribution': {
-                'total_providers': len(providers),
+                'total_providers': provider_count,
                 'providers_with_active_leases': 0,
             },
         }
 
-        # Count providers with active leases
-        providers_with_leases = set()
-        for lease in leases:
-            try:
-                lease_data = lease.get('lease', {})
-                lease_id = lease_data.get('lease_id', {})
-                provider = lease_id.get('provider', '')
-                if provider:
-                    providers_with_leases.add(provider)
-            except:
-                continue
-
         stats['provider_distribution']['providers_with_active_leases'] = len(providers_with_leases)
 
         # Calculate utilization rate
@@ -226,47 +235,73 @@ class ResourceUsageCollector:
 
         return stats
 
+    def stream_provider_capacity(self, timestamp: Optional[str] = None) -> List[Dict]:
+        """Fetch providers page by page, keeping only their analyzed records"""
+        logger.info("Collecting providers from Akash Network...")
+
+        endpoint = self.config.get('akash', 'endpoints', 'providers', default='/akash/provider/v1beta3/providers')
+        page_size = self.config.get('collection', 'page_size', default=100)
+
+        provider_data = []
+        for page in self.api_client.iter_pages(endpoint, page_size):
+            provider_data.extend(self.analyze_provider_capacity(page, timestamp))
+
+        logger.info(f"Collected {len(provider_data)} providers")
+        return provider_data
+
+    def stream_lease_resources(self, timestamp: Optional[str] = None) -> Tuple[int, Set[str]]:
+        """Fetch leases page by page, streaming their records to storage
+
+        Returns:
+            The lease count and the set of providers serving them
+        """
+        logger.info("Collecting leases for resource analysis...")
+
+        endpoint = self.config.get('akash', 'endpoints', 'leases', default='/akash/market/v1beta3/leases/list')
+        page_size = self.config.get('collection', 'page_size', default=100)
+
+        lease_count = 0
+        providers_with_leases = set()
+        with self.storage.open_stream('lease_resources') as writer:
+            for page in self.api_client.iter_pages(endpoint, page_size):
+                lease_count += len(page)
+                providers_with_leases |= self._lease_providers(page)
+                lease_resources, _ = self.analyze_lease_resources(page, timestamp)
+                writer.write_many(lease_resources)
+
+        logger.info(f"Collected {lease_count} leases")
+        return lease_count, providers_with_leases
+
     def run(self):
         """Run the resource collection process"""
         console.print("\n[bold blue]Akash Network - Resource Usage Collector[/bold blue]\n")
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-
-            # Collect providers
-            task1 = progress.add_task("Collecting providers...", total=None)
-            providers = self.collect_providers()
-            progress.update(task1, completed=True)
-
-            # Collect leases
-            task2 = progress.add_task("Collecting leases...", total=None)
-            leases = self.collect_leases()
-            progress.update(task2, completed=True)
-
-            # Analyze resources
-            task3 = progress.add_task("Analyzing lease resources...", total=None)
-            lease_resources, total_resources = self.analyze_lease_resources(leases)
-            progress.update(task3, completed=True)
+        with progress_spinner(console) as progress:
 
-            # Analyze provider capacity
-            task4 = progress.add_task("Analyzing provider capacity...", total=None)
-            provider_data = self.analyze_provider_capacity(providers)
-            progress.update(task4, completed=True)
+            # Providers and leases are independent, so collect them concurrently. Each
+            # page is analyzed as it arrives, so the raw responses are never all held
+            timestamp = datetime.now().isoformat()
+            task1 = progress.add_task("Collecting and analyzing providers...", total=None)
+            task2 = progress.add_task("Collecting and analyzing leases...", total=None)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                providers_future = executor.submit(self.stream_provider_capacity, timestamp)
+                leases_future = executor.submit(self.stream_lease_resources, timestamp)
+
+                provider_data = providers_future.result()
+                progress.update(task1, completed=True)
+                lease_count, providers_with_leases = leases_future.result()
+                progress.update(task2, completed=True)
 
             # Calculate statistics
-            task5 = progress.add_task("Calculating network statistics...", total=None)
-            stats = self.calculate_network_statistics(leases, providers)
-            progress.update(task5, completed=True)
+            task3 = progress.add_task("Calculating network statistics...", total=None)
+            stats = self._network_statistics(lease_count, len(provider_data), providers_with_leases)
+            progress.update(task3, completed=True)
 
             # Save data
-            task6 = progress.add_task("Saving data...", total=None)
-            self.storage.save(lease_resources, 'lease_resources')
+            task4 = progress.add_task("Saving data...", total=None)
             self.storage.save(provider_data, 'provider_capacity')
             self.storage.save(stats, 'network_statistics')
-            progress.update(task6, completed=True)
+            progress.update(task4, completed=True)
 
         # Display summary
         console.print("\n[bold green]Collection Complete![/bold green]\n")
@@ -290,13 +325,17 @@ class ResourceUsageCollector:
         console.print(table)
         console.print()
 
+        # The snapshots were written in the background while the summary was shown
+        self.storage.flush()
+
         return stats
 
 
 @click.command()
 @click.option('--config', default='config.yaml', help='Path to configuration file')
 @click.option('--verbose', is_flag=True, help='Enable verbose logging')
-def main(config, verbose):
+@click.option('--no-cache', is_flag=True, help='Ignore the API response cache and fetch fresh data')
+def main(config, verbose, no_cache):
     """Collect resource usage data from Akash Network"""
 
     # Load configuration
@@ -304,9 +343,13 @@ def main(config, verbose):
 
     # Setup logging
     if verbose:
-        cfg.config['logging']['level'] = 'DEBUG'
+        cfg.set('logging', 'level', value='DEBUG')
     setup_logging(cfg)
 
+    if no_cache and cfg.get('akash', 'page_cache'):
+        cfg.set('akash', 'page_cache', 'enabled', value=False)
+        cfg.set('akash', 'page_cache', 'shared_ttl', value=0)
+
     # Run collector
     collector = ResourceUsageCollector(cfg)
     collector.run()
@@ -8,23 +8,241 @@ for easier analysis and visualization.
 
 import sys
 import os
-import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict
-from collections import defaultdict
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 import click
+import numpy as np
+import pandas as pd
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
 # Add parent directory to path to import utils
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from utils import Config, setup_logging
+from utils import Config, loads_json, parse_timestamp, progress_spinner, setup_logging, write_json_atomic
 from loguru import logger
 
 console = Console()
 
+_INTERVALS = ('hourly', 'daily', 'weekly', 'monthly')
+
+# Bumped whenever the cached per-file fields change shape
+_MANIFEST_VERSION = 1
+
+# Errors raised by records that do not have the expected shape
+_MALFORMED = (KeyError, TypeError, ValueError)
+
+_TICKS_PER_SECOND = {'s': 1, 'ms': 10 ** 3, 'us': 10 ** 6, 'ns': 10 ** 9}
+
+# Width and origin in seconds of the fixed-width intervals; weeks start on
+# Monday and 1970-01-05 was the first Monday after the epoch
+_BUCKET_WIDTHS = {'hourly': (3600, 0), 'daily': (86400, 0), 'weekly': (7 * 86400, 4 * 86400)}
+
+
+def _bucket_start(timestamp: datetime, interval: str) -> datetime:
+    """Start of the interval bucket containing a timestamp"""
+    if interval == 'hourly':
+        return timestamp.replace(minute=0, second=0, microsecond=0)
+    if interval == 'daily':
+        return timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+    if interval == 'weekly':
+        bucket = timestamp - timedelta(days=timestamp.weekday())
+        return bucket.replace(hour=0, minute=0, second=0, microsecond=0)
+    return timestamp.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _from_isoformat(value) -> Optional[datetime]:
+    """Parse one ISO timestamp, or None if it is not one"""
+    try:
+        return parse_timestamp(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_timestamps(timestamps: List[str]) -> pd.Series:
+    """Parse ISO timestamps into a datetime column, NaT where a value does not parse"""
+    try:
+        return pd.to_datetime(pd.Series(timestamps, dtype=object), format='ISO8601', errors='coerce')
+    except (TypeError, ValueError):
+        # Mixed UTC offsets cannot share one datetime64 column, so keep Python datetimes
+        return pd.Series([_from_isoformat(t) for t in timestamps], dtype=object)
+
+
+class _CostColumns(NamedTuple):
+    """Fields of the well-formed cost records, one column per field"""
+    timestamps: pd.Series
+    daily: np.ndarray
+    monthly: np.ndarray
+    owners: List[str]
+    providers: List[str]
+
+
+class _LeaseColumns(NamedTuple):
+    """Fields of the well-formed lease resource records, one column per field"""
+    timestamps: pd.Series
+    providers: List[str]
+    owners: List[str]
+
+
+def _intern(value):
+    """Intern address strings so repeated owners/providers share one object"""
+    # Addresses repeat across thousands of records; interning keeps one copy of
+    # each in memory and lets the distinct counts compare by identity
+    return sys.intern(value) if type(value) is str else value
+
+
+def _cost_fields(costs: Iterable[Dict]) -> Dict[str, List]:
+    """Pull the aggregated fields out of cost records in a single pass, one list per field"""
+    timestamps, daily, monthly, owners, providers = [], [], [], [], []
+    for cost in costs:
+        # Only structural problems (missing keys, wrong types, non-numeric costs)
+        # mark a record as malformed; anything else is a bug and should surface
+        try:
+            pricing = cost['pricing']
+            row = (
+                cost['timestamp'],
+                float(pricing['daily_cost_usd']),
+                float(pricing['monthly_cost_usd']),
+                cost['deployment_id']['owner'],
+                cost['lease_id']['provider'],
+            )
+        except _MALFORMED as e:
+            logger.warning(f"Skipping malformed cost record: {e!r}")
+            continue
+        timestamps.append(row[0])
+        daily.append(row[1])
+        monthly.append(row[2])
+        owners.append(row[3])
+        providers.append(row[4])
+
+    return {'timestamps': timestamps, 'daily': daily, 'monthly': monthly, 'owners': owners, 'providers': providers}
+
+
+def _cost_columns(fields: Dict[str, List]) -> _CostColumns:
+    """Parse and validate extracted cost fields into aggregation columns"""
+    parsed = _parse_timestamps(fields['timestamps'])
+    valid = parsed.notna().to_numpy()
+    return _CostColumns(
+        parsed[valid].reset_index(drop=True),
+        np.array(fields['daily'], dtype=np.float64)[valid],
+        np.array(fields['monthly'], dtype=np.float64)[valid],
+        _select(map(_intern, fields['owners']), valid),
+        _select(map(_intern, fields['providers']), valid),
+    )
+
+
+def _lease_fields(resources: Iterable[Dict]) -> Dict[str, List]:
+    """Pull the aggregated fields out of lease resource records in a single pass, one list per field"""
+    timestamps, providers, owners = [], [], []
+    for resource in resources:
+        try:
+            lease_id = resource['lease_id']
+            row = (resource['timestamp'], lease_id['provider'], lease_id['owner'])
+        except _MALFORMED as e:
+            logger.warning(f"Skipping malformed resource record: {e!r}")
+            continue
+        timestamps.append(row[0])
+        providers.append(row[1])
+        owners.append(row[2])
+
+    return {'timestamps': timestamps, 'providers': providers, 'owners': owners}
+
+
+def _lease_columns(fields: Dict[str, List]) -> _LeaseColumns:
+    """Parse and validate extracted lease fields into aggregation columns"""
+    parsed = _parse_timestamps(fields['timestamps'])
+    valid = parsed.notna().to_numpy()
+    return _LeaseColumns(
+        parsed[valid].reset_index(drop=True),
+        _select(map(_intern, fields['providers']), valid),
+        _select(map(_intern, fields['owners']), valid),
+    )
+
+
+def _bucket_codes(timestamps: pd.Series, interval: str) -> Tuple[np.ndarray, List[str]]:
+    """Bucket index of each timestamp (-1 if missing) and the ISO start of every bucket"""
+    if timestamps.dtype == object:
+        # Records of one collection run share a timestamp, so compute each distinct
+        # bucket start once. The key includes tzinfo because equal instants with
+        # different offsets fall in different local buckets
+        starts = {}
+        bucket_keys = []
+        for t in timestamps.tolist():
+            if t is None:
+                bucket_keys.append(None)
+                continue
+            key = (t, t.tzinfo)
+            start = starts.get(key)
+            if start is None:
+                start = starts[key] = _bucket_start(t, interval).isoformat()
+            bucket_keys.append(start)
+        codes, buckets = pd.factorize(np.array(bucket_keys, dtype=object))
+        return codes, buckets.tolist()
+
+    # Bucket on local wall-clock time, like datetime.replace() would
+    tz = timestamps.dt.tz
+    local = (timestamps.dt.tz_localize(None) if tz is not None else timestamps).to_numpy()
+
+    if interval == 'monthly':
+        starts = local.astype('datetime64[M]').astype(local.dtype)
+    else:
+        # Floor the integer ticks to the interval width
+        second = _TICKS_PER_SECOND[np.datetime_data(local.dtype)[0]]
+        width, origin = _BUCKET_WIDTHS[interval]
+        ticks = local.view(np.int64)
+        starts = (ticks - (ticks - origin * second) % (width * second)).view(local.dtype)
+        starts[np.isnat(local)] = np.datetime64('NaT')
+
+    codes, buckets = pd.factorize(starts)
+    buckets = pd.DatetimeIndex(buckets)
+    if tz is not None:
+        buckets = buckets.tz_localize(tz)
+    return codes, [bucket.isoformat() for bucket in buckets]
+
+
+def _first_last_seen(codes: np.ndarray, timestamps: pd.Series, n: int) -> Tuple[List, List]:
+    """Earliest and latest timestamp in each of n groups"""
+    if timestamps.dtype != object:
+        grouped = timestamps.groupby(codes)
+        return grouped.min().tolist(), grouped.max().tolist()
+
+    first, last = [None] * n, [None] * n
+    for code, timestamp in zip(codes.tolist(), timestamps.tolist()):
+        try:
+            if first[code] is None or timestamp < first[code]:
+                first[code] = timestamp
+            if last[code] is None or timestamp > last[code]:
+                last[code] = timestamp
+        except TypeError:
+            # Naive and offset-aware timestamps cannot be compared
+            continue
+    return first, last
+
+
+def _select(values: Iterable, mask: np.ndarray) -> List:
+    """Values at the positions where mask is set"""
+    return [value for value, keep in zip(values, mask.tolist()) if keep]
+
+
+def _distinct_per_bucket(codes: np.ndarray, values: List, n: int) -> List[int]:
+    """Number of distinct values in each of n buckets"""
+    value_codes, uniques = pd.factorize(np.array(values, dtype=object), use_na_sentinel=False)
+    if not len(uniques):
+        return [0] * n
+    pairs = np.unique(codes.astype(np.int64) * len(uniques) + value_codes)
+    return np.bincount(pairs // len(uniques), minlength=n).tolist()
+
+
+def _load_file(file: Path):
+    """Read and parse one JSON file, or None if it cannot be loaded"""
+    try:
+        return loads_json(file.read_bytes())
+    except Exception as e:
+        logger.warning(f"Error loading {file}: {e}")
+        return None
+
 
 class DataAggregator:
     """Aggregates collected data into time-based summaries"""
@@ -34,173 +252,201 @@ class DataAggregator:
         self.data_path = Path(config.get('storage', 'file', 'base_path', default='./collected_data'))
         self.output_path = Path('./processed_data')
         self.output_path.mkdir(parents=True, exist_ok=True)
+        # Compact output unless pretty-printing is asked for
+        self.indent = 2 if config.get('processing', 'pretty_output', default=False) else None
+        self.load_workers = config.get('processing', 'load_workers', default=4)
+        # Reuse the fields extracted from unchanged files on earlier runs
+        self.incremental = config.get('processing', 'incremental', default=True)
 
     def load_json_files(self, pattern: str) -> List[Dict]:
         """Load all JSON files matching a pattern"""
+        data = list(self.iter_json_records(pattern))
+        logger.info(f"Loaded {len(data)} records")
+        return data
+
+    def iter_json_records(self, pattern: str) -> Iterator[Dict]:
+        """Yield the records of every JSON file matching a pattern, a few files in memory at a time"""
         files = sorted(self.data_path.glob(f"{pattern}_*.json"))
-        data = []
 
+        for content in self._iter_file_contents(files):
+            if content is None:
+                continue
+            if isinstance(content, list):
+                yield from content
+            else:
+                yield content
+
+        logger.info(f"Read {len(files)} {pattern} files")
+
+    def _iter_file_contents(self, files: List[Path]) -> Iterator:
+        """Read and parse files on a thread pool, yielding their contents (None if unreadable) in file order"""
+        if self.load_workers <= 1 or len(files) <= 1:
+            for file in files:
+                yield _load_file(file)
+            return
+
+        # Keep a bounded window of files in flight so reads overlap with parsing
+        # and consumption without loading every file at once
+        with ThreadPoolExecutor(max_workers=self.load_workers) as executor:
+            in_flight = deque()
+            for file in files:
+                in_flight.append(executor.submit(_load_file, file))
+                if len(in_flight) >= self.load_workers * 2:
+                    yield in_flight.popleft().result()
+            while in_flight:
+                yield in_flight.popleft().result()
+
+    def load_fields(self, pattern: str, extract: Callable[[Iterable[Dict]], Dict[str, List]]) -> Dict[str, List]:
+        """Extracted fields of every file matching a pattern, re-reading only new or changed files"""
+        files = sorted(self.data_path.glob(f"{pattern}_*.json"))
+        manifest_file = self.output_path / f'.{pattern}_fields.json'
+        cached = self._load_manifest(manifest_file) if self.incremental else {}
+
+        # A file is reused while its modification time and size are unchanged
+        entries = {}
+        stale = []
         for file in files:
+            stat = file.stat()
+            signature = [stat.st_mtime_ns, stat.st_size]
+            entry = cached.get(file.name)
+            if isinstance(entry, dict) and entry.get('signature') == signature:
+                entries[file.name] = entry
+            else:
+                stale.append((file, signature))
+
+        contents = self._iter_file_contents([file for file, _ in stale])
+        for (file, signature), content in zip(stale, contents):
+            # Unreadable files are left out of the manifest and retried next run
+            if content is None:
+                continue
+            records = content if isinstance(content, list) else [content]
+            entries[file.name] = {'signature': signature, 'fields': extract(records)}
+
+        logger.info(f"Read {len(stale)} new or changed {pattern} files, reused {len(files) - len(stale)}")
+
+        if self.incremental and (stale or entries.keys() != cached.keys()):
             try:
-                with open(file, 'r') as f:
-                    content = json.load(f)
-                    if isinstance(content, list):
-                        data.extend(content)
-                    else:
-                        data.append(content)
+                write_json_atomic(manifest_file, {'version': _MANIFEST_VERSION, 'files': entries})
             except Exception as e:
-                logger.warning(f"Error loading {file}: {e}")
+                logger.warning(f"Error saving {manifest_file}: {e}")
 
-        logger.info(f"Loaded {len(data)} records from {len(files)} files")
-        return data
+        fields = extract(())
+        for file in files:
+            entry = entries.get(file.name)
+            if entry is not None:
+                for name, values in entry['fields'].items():
+                    fields[name].extend(values)
+        return fields
+
+    @staticmethod
+    def _load_manifest(manifest_file: Path) -> Dict[str, Dict]:
+        """Per-file extracted fields saved by a previous run, keyed by file name"""
+        try:
+            manifest = loads_json(manifest_file.read_bytes())
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable {manifest_file}: {e}")
+            return {}
 
-    def aggregate_costs_by_time(self, costs: List[Dict], interval: str = 'hourly') -> Dict:
-        """Aggregate costs by time interval"""
-        aggregated = defaultdict(lambda: {
-            'total_daily_usd': 0,
-            'total_monthly_usd': 0,
-            'lease_count': 0,
-            'unique_owners': set(),
-            'unique_providers': set(),
-        })
-
-        for cost in costs:
-            try:
-                timestamp = datetime.fromisoformat(cost['timestamp'])
-
-                # Determine time bucket based on interval
-                if interval == 'hourly':
-                    bucket = timestamp.replace(minute=0, second=0, microsecond=0)
-                elif interval == 'daily':
-                    bucket = timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
-                elif interval == 'weekly':
-                    bucket = timestamp - timedelta(days=timestamp.weekday())
-                    bucket = bucket.replace(hour=0, minute=0, second=0, microsecond=0)
-                elif interval == 'monthly':
-                    bucket = timestamp.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-                else:
-                    logger.error(f"Unknown interval: {interval}")
-                    continue
-
-                bucket_key = bucket.isoformat()
-
-                # Aggregate data
-                aggregated[bucket_key]['total_daily_usd'] += cost['pricing']['daily_cost_usd']
-                aggregated[bucket_key]['total_monthly_usd'] += cost['pricing']['monthly_cost_usd']
-                aggregated[bucket_key]['lease_count'] += 1
-                aggregated[bucket_key]['unique_owners'].add(cost['deployment_id']['owner'])
-                aggregated[bucket_key]['unique_providers'].add(cost['lease_id']['provider'])
+        if not isinstance(manifest, dict) or manifest.get('version') != _MANIFEST_VERSION:
+            return {}
+        return manifest.get('files') or {}
 
-            except Exception as e:
-                logger.warning(f"Error aggregating cost: {e}")
-                continue
+    def aggregate_costs_by_time(self, costs: Iterable[Dict], interval: str = 'hourly') -> Dict:
+        """Aggregate costs by time interval"""
+        if interval not in _INTERVALS:
+            logger.error(f"Unknown interval: {interval}")
+            return {}
+        return self._aggregate_cost_columns(_cost_columns(_cost_fields(costs)), interval)
+
+    def aggregate_costs_all_intervals(self, costs: Iterable[Dict]) -> Dict[str, Dict]:
+        """Aggregate costs by every time interval from a single pass over the records"""
+        columns = _cost_columns(_cost_fields(costs))
+        return {interval: self._aggregate_cost_columns(columns, interval) for interval in _INTERVALS}
+
+    def _aggregate_cost_columns(self, columns: _CostColumns, interval: str) -> Dict:
+        """Reduce cost columns per time bucket"""
+        codes, buckets = _bucket_codes(columns.timestamps, interval)
+        n = len(buckets)
+
+        total_daily = np.bincount(codes, weights=columns.daily, minlength=n).tolist()
+        total_monthly = np.bincount(codes, weights=columns.monthly, minlength=n).tolist()
+        lease_counts = np.bincount(codes, minlength=n).tolist()
+        unique_owners = _distinct_per_bucket(codes, columns.owners, n)
+        unique_providers = _distinct_per_bucket(codes, columns.providers, n)
 
-        # Convert sets to counts
         result = {}
-        for bucket, data in aggregated.items():
+        for i, bucket in enumerate(buckets):
             result[bucket] = {
                 'timestamp': bucket,
-                'total_daily_usd': data['total_daily_usd'],
-                'total_monthly_usd': data['total_monthly_usd'],
-                'average_daily_usd': data['total_daily_usd'] / data['lease_count'] if data['lease_count'] > 0 else 0,
-                'lease_count': data['lease_count'],
-                'unique_owners': len(data['unique_owners']),
-                'unique_providers': len(data['unique_providers']),
+                'total_daily_usd': total_daily[i],
+                'total_monthly_usd': total_monthly[i],
+                'average_daily_usd': total_daily[i] / lease_counts[i] if lease_counts[i] > 0 else 0,
+                'lease_count': lease_counts[i],
+                'unique_owners': unique_owners[i],
+                'unique_providers': unique_providers[i],
             }
 
         return dict(sorted(result.items()))
 
-    def aggregate_resources_by_time(self, resources: List[Dict], interval: str = 'hourly') -> Dict:
+    def aggregate_resources_by_time(self, resources: Iterable[Dict], interval: str = 'hourly') -> Dict:
         """Aggregate resource usage by time interval"""
-        aggregated = defaultdict(lambda: {
-            'total_leases': 0,
-            'unique_providers': set(),
-            'unique_owners': set(),
-        })
+        if interval not in _INTERVALS:
+            return {}
+        return self._aggregate_lease_columns(_lease_columns(_lease_fields(resources)), interval)
 
-        for resource in resources:
-            try:
-                timestamp = datetime.fromisoformat(resource['timestamp'])
-
-                # Determine time bucket
-                if interval == 'hourly':
-                    bucket = timestamp.replace(minute=0, second=0, microsecond=0)
-                elif interval == 'daily':
-                    bucket = timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
-                elif interval == 'weekly':
-                    bucket = timestamp - timedelta(days=timestamp.weekday())
-                    bucket = bucket.replace(hour=0, minute=0, second=0, microsecond=0)
-                elif interval == 'monthly':
-                    bucket = timestamp.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-                else:
-                    continue
-
-                bucket_key = bucket.isoformat()
-
-                # Aggregate data
-                aggregated[bucket_key]['total_leases'] += 1
-                aggregated[bucket_key]['unique_providers'].add(resource['lease_id']['provider'])
-                aggregated[bucket_key]['unique_owners'].add(resource['lease_id']['owner'])
+    def aggregate_resources_all_intervals(self, resources: Iterable[Dict]) -> Dict[str, Dict]:
+        """Aggregate resource usage by every time interval from a single pass over the records"""
+        columns = _lease_columns(_lease_fields(resources))
+        return {interval: self._aggregate_lease_columns(columns, interval) for interval in _INTERVALS}
 
-            except Exception as e:
-                logger.warning(f"Error aggregating resource: {e}")
-                continue
+    def _aggregate_lease_columns(self, columns: _LeaseColumns, interval: str) -> Dict:
+        """Reduce lease resource columns per time bucket"""
+        codes, buckets = _bucket_codes(columns.timestamps, interval)
+        n = len(buckets)
+
+        lease_counts = np.bincount(codes, minlength=n).tolist()
+        unique_providers = _distinct_per_bucket(codes, columns.providers, n)
+        unique_owners = _distinct_per_bucket(codes, columns.owners, n)
 
-        # Convert sets to counts
         result = {}
-        for bucket, data in aggregated.items():
+        for i, bucket in enumerate(buckets):
             result[bucket] = {
                 'timestamp': bucket,
-                'total_leases': data['total_leases'],
-                'unique_providers': len(data['unique_providers']),
-                'unique_owners': len(data['unique_owners']),
+                'total_leases': lease_counts[i],
+                'unique_providers': unique_providers[i],
+                'unique_owners': unique_owners[i],
             }
 
         return dict(sorted(result.items()))
 
-    def calculate_provider_statistics(self, costs: List[Dict]) -> Dict:
+    def calculate_provider_statistics(self, costs: Iterable[Dict]) -> Dict:
         """Calculate per-provider statistics"""
-        provider_stats = defaultdict(lambda: {
-            'total_leases': 0,
-            'total_daily_usd': 0,
-            'total_monthly_usd': 0,
-            'unique_owners': set(),
-            'first_seen': None,
-            'last_seen': None,
-        })
-
-        for cost in costs:
-            try:
-                provider = cost['lease_id']['provider']
-                timestamp = datetime.fromisoformat(cost['timestamp'])
-
-                provider_stats[provider]['total_leases'] += 1
-                provider_stats[provider]['total_daily_usd'] += cost['pricing']['daily_cost_usd']
-                provider_stats[provider]['total_monthly_usd'] += cost['pricing']['monthly_cost_usd']
-                provider_stats[provider]['unique_owners'].add(cost['deployment_id']['owner'])
+        return self._provider_statistics(_cost_columns(_cost_fields(costs)))
+
+    def _provider_statistics(self, columns: _CostColumns) -> Dict:
+        """Reduce cost columns per provider"""
+        # Group by provider: factorize keeps first-seen order, bincount sums per group
+        codes, unique_providers = pd.factorize(np.array(columns.providers, dtype=object), use_na_sentinel=False)
+        n = len(unique_providers)
+        lease_counts = np.bincount(codes, minlength=n).tolist()
+        total_daily = np.bincount(codes, weights=columns.daily, minlength=n).tolist()
+        total_monthly = np.bincount(codes, weights=columns.monthly, minlength=n).tolist()
+        unique_owners = _distinct_per_bucket(codes, columns.owners, n)
+        first_seen, last_seen = _first_last_seen(codes, columns.timestamps, n)
 
-                # Track first and last seen
-                if not provider_stats[provider]['first_seen'] or timestamp < provider_stats[provider]['first_seen']:
-                    provider_stats[provider]['first_seen'] = timestamp
-                if not provider_stats[provider]['last_seen'] or timestamp > provider_stats[provider]['last_seen']:
-                    provider_stats[provider]['last_seen'] = timestamp
-
-            except Exception as e:
-                logger.warning(f"Error calculating provider stats: {e}")
-                continue
-
-        # Convert to serializable format
         result = {}
-        for provider, stats in provider_stats.items():
+        for i, provider in enumerate(unique_providers.tolist()):
             result[provider] = {
                 'provider_address': provider,
-                'total_leases': stats['total_leases'],
-                'total_daily_usd': stats['total_daily_usd'],
-                'total_monthly_usd': stats['total_monthly_usd'],
-                'average_daily_usd': stats['total_daily_usd'] / stats['total_leases'] if stats['total_leases'] > 0 else 0,
-                'unique_owners': len(stats['unique_owners']),
-                'first_seen': stats['first_seen'].isoformat() if stats['first_seen'] else None,
-                'last_seen': stats['last_seen'].isoformat() if stats['last_seen'] else None,
+                'total_leases': lease_counts[i],
+                'total_daily_usd': total_daily[i],
+                'total_monthly_usd': total_monthly[i],
+                'average_daily_usd': total_daily[i] / lease_counts[i] if lease_counts[i] > 0 else 0,
+                'unique_owners': unique_owners[i],
+                'first_seen': first_seen[i].isoformat() if first_seen[i] is not None else None,
+                'last_seen': last_seen[i].isoformat() if last_seen[i] is not None else None,
             }
 
         # Sort by total revenue
@@ -213,8 +459,7 @@ class DataAggregator:
         output_file = self.output_path / filename
 
         try:
-            with open(output_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            write_json_atomic(output_file, data, indent=self.indent)
             logger.info(f"Saved aggregated data to {output_file}")
         except Exception as e:
             logger.error(f"Error saving data: {e}")
@@ -223,54 +468,53 @@ class DataAggregator:
         """Run the aggregation process"""
         console.print("\n[bold blue]Akash Network - Data Aggregator[/bold blue]\n")
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
+        with progress_spinner(console) as progress:
 
-            # Load cost data
+            # Read the cost records once; every interval and the provider stats
+            # are computed from the same columns
             task1 = progress.add_task("Loading cost data...", total=None)
-            costs = self.load_json_files('deployment_costs')
+            costs = _cost_columns(self.load_fields('deployment_costs', _cost_fields))
             progress.update(task1, completed=True)
 
-            if costs:
+            if costs.owners:
                 # Aggregate costs by different time intervals
                 task2 = progress.add_task("Aggregating costs...", total=None)
-                for interval in ['hourly', 'daily', 'weekly', 'monthly']:
-                    aggregated = self.aggregate_costs_by_time(costs, interval)
+                for interval in _INTERVALS:
+                    aggregated = self._aggregate_cost_columns(costs, interval)
                     self.save_aggregated_data(aggregated, f'costs_{interval}.json')
                 progress.update(task2, completed=True)
 
                 # Calculate provider statistics
                 task3 = progress.add_task("Calculating provider stats...", total=None)
-                provider_stats = self.calculate_provider_statistics(costs)
+                provider_stats = self._provider_statistics(costs)
                 self.save_aggregated_data(provider_stats, 'provider_statistics.json')
                 progress.update(task3, completed=True)
 
             # Load resource data
             task4 = progress.add_task("Loading resource data...", total=None)
-            resources = self.load_json_files('lease_resources')
+            resources = _lease_columns(self.load_fields('lease_resources', _lease_fields))
             progress.update(task4, completed=True)
 
-            if resources:
+            if resources.owners:
                 # Aggregate resources by different time intervals
                 task5 = progress.add_task("Aggregating resources...", total=None)
-                for interval in ['hourly', 'daily', 'weekly', 'monthly']:
-                    aggregated = self.aggregate_resources_by_time(resources, interval)
+                for interval in _INTERVALS:
+                    aggregated = self._aggregate_lease_columns(resources, interval)
                     self.save_aggregated_data(aggregated, f'resources_{interval}.json')
                 progress.update(task5, completed=True)
 
         console.print("\n[bold green]Aggregation Complete![/bold green]\n")
-        console.print(f"Processed {len(costs)} cost records")
-        console.print(f"Processed {len(resources)} resource records")
+        console.print(f"Processed {len(costs.owners)} cost records")
+        console.print(f"Processed {len(resources.owners)} resource records")
         console.print(f"Output saved to: {self.output_path}\n")
 
 
 @click.command()
 @click.option('--config', default='config.yaml', help='Path to configuration file')
 @click.option('--verbose', is_flag=True, help='Enable verbose logging')
-def main(config, verbose):
+@click.option('--pretty', is_flag=True, help='Indent the JSON output for readability')
+@click.option('--no-cache', is_flag=True, help='Re-read every collected file instead of reusing fields cached by earlier runs')
+def main(config, verbose, pretty, no_cache):
     """Aggregate collected data into time-based summaries"""
 
     # Load configuration
@@ -278,9 +522,14 @@ def main(config, verbose):
 
     # Setup logging
     if verbose:
-        cfg.config['logging']['level'] = 'DEBUG'
+        cfg.set('logging', 'level', value='DEBUG')
     setup_logging(cfg)
 
+    if pretty:
+        cfg.set('processing', 'pretty_output', value=True)
+    if no_cache:
+        cfg.set('processing', 'incremental', value=False)
+
     # Run aggregator
     aggregator = DataAggregator(cfg)
     aggregator.run()
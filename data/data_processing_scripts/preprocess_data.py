@@ -8,23 +8,48 @@ and prepares it for frontend consumption.
 
 import sys
 import os
-import json
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import click
+import numpy as np
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
 # Add parent directory to path to import utils
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from utils import Config, setup_logging
+from utils import Config, loads_json, parse_timestamp, progress_spinner, setup_logging, write_json_atomic
 from loguru import logger
 
 console = Console()
 
 
+# Shared read-only default for missing nested objects
+_EMPTY: Dict = {}
+
+
+def _timestamp_fields(value: str) -> Tuple[str, str, int]:
+    """Readable timestamp, date and hour for an ISO timestamp string"""
+    ts = parse_timestamp(value)
+    return ts.strftime('%Y-%m-%d %H:%M:%S'), ts.strftime('%Y-%m-%d'), ts.hour
+
+
+def _field_getter(field: str) -> Callable[[Dict], str]:
+    """Build an accessor returning a (possibly nested, dot-separated) field as a string"""
+    if '.' not in field:
+        return lambda record: str(record.get(field, ''))
+
+    parts = field.split('.')
+
+    def getter(record: Dict) -> str:
+        value = record
+        for part in parts:
+            value = value.get(part, '')
+        return str(value)
+
+    return getter
+
+
 class DataPreprocessor:
     """Preprocesses and cleans collected data"""
 
@@ -33,6 +58,9 @@ class DataPreprocessor:
         self.data_path = Path(config.get('storage', 'file', 'base_path', default='./collected_data'))
         self.output_path = Path('./processed_data')
         self.output_path.mkdir(parents=True, exist_ok=True)
+        # Compact output unless pretty-printing is asked for
+        self.indent = 2 if config.get('processing', 'pretty_output', default=False) else None
+        self.parquet_output = config.get('processing', 'parquet_output', default=True)
 
         self.cleanup_config = config.get('processing', 'cleanup', default={})
         self.remove_duplicates = self.cleanup_config.get('remove_duplicates', True)
@@ -47,12 +75,11 @@ class DataPreprocessor:
         # Load recent files (last 10)
         for file in files[-10:]:
             try:
-                with open(file, 'r') as f:
-                    content = json.load(f)
-                    if isinstance(content, list):
-                        data.extend(content)
-                    else:
-                        data.append(content)
+                content = loads_json(file.read_bytes())
+                if isinstance(content, list):
+                    data.extend(content)
+                else:
+                    data.append(content)
             except Exception as e:
                 logger.warning(f"Error loading {file}: {e}")
 
@@ -64,25 +91,16 @@ class DataPreprocessor:
         if not self.remove_duplicates:
             return data
 
+        # Resolve the dotted field paths once instead of per record
+        getters = [_field_getter(field) for field in key_fields]
         seen = set()
         unique_data = []
 
         for record in data:
             try:
-                # Create a key from specified fields
-                key_parts = []
-                for field in key_fields:
-                    if '.' in field:
-                        # Handle nested fields
-                        parts = field.split('.')
-                        value = record
-                        for part in parts:
-                            value = value.get(part, '')
-                        key_parts.append(str(value))
-                    else:
-                        key_parts.append(str(record.get(field, '')))
-
-                key = '|'.join(key_parts)
+                # A tuple hashes the parts directly instead of building a joined string,
+                # and parts containing '|' can no longer collide
+                key = tuple([getter(record) for getter in getters])
 
                 if key not in seen:
                     seen.add(key)
@@ -103,59 +121,52 @@ class DataPreprocessor:
         if not self.fill_missing:
             return data
 
+        # Records missing a timestamp all get the time of this run
+        now = datetime.now().isoformat()
+
         for record in data:
             try:
-                # Fill missing timestamps
-                if 'timestamp' not in record or not record['timestamp']:
-                    record['timestamp'] = datetime.now().isoformat()
-
-                # Fill missing numeric values with 0
-                if 'pricing' in record:
-                    pricing = record['pricing']
-                    for key in ['daily_cost_usd', 'monthly_cost_usd', 'akt_usd_rate']:
-                        if key not in pricing or pricing[key] is None:
-                            pricing[key] = 0
-
+                self._fill_record(record, now)
             except Exception as e:
                 logger.warning(f"Error filling missing values: {e}")
 
         return data
 
+    @staticmethod
+    def _fill_record(record: Dict, now: str):
+        """Fill the missing values of one record in place"""
+        # Fill missing timestamps
+        if not record.get('timestamp'):
+            record['timestamp'] = now
+
+        # Fill missing numeric values with 0
+        if 'pricing' in record:
+            pricing = record['pricing']
+            for key in ['daily_cost_usd', 'monthly_cost_usd', 'akt_usd_rate']:
+                if key not in pricing or pricing[key] is None:
+                    pricing[key] = 0
+
     def detect_and_flag_outliers(self, data: List[Dict]) -> List[Dict]:
         """Detect and flag statistical outliers in cost data"""
         if not self.detect_outliers or len(data) < 10:
             return data
 
         try:
-            # Calculate statistics for daily costs
-            daily_costs = []
+            # Pull the daily costs once; records without one are left unflagged
+            priced = []
+            costs = []
             for record in data:
                 if 'pricing' in record and 'daily_cost_usd' in record['pricing']:
-                    cost = record['pricing']['daily_cost_usd']
-                    if cost > 0:
-                        daily_costs.append(cost)
+                    priced.append(record)
+                    costs.append(record['pricing']['daily_cost_usd'])
 
-            if not daily_costs:
+            flags = self._outlier_flags(costs)
+            if flags is None:
                 return data
 
-            # Calculate mean and standard deviation
-            mean = sum(daily_costs) / len(daily_costs)
-            variance = sum((x - mean) ** 2 for x in daily_costs) / len(daily_costs)
-            std_dev = variance ** 0.5
-
-            # Flag outliers (3 standard deviations from mean)
-            threshold_low = mean - (3 * std_dev)
-            threshold_high = mean + (3 * std_dev)
-
-            outlier_count = 0
-            for record in data:
-                if 'pricing' in record and 'daily_cost_usd' in record['pricing']:
-                    cost = record['pricing']['daily_cost_usd']
-                    if cost < threshold_low or cost > threshold_high:
-                        record['is_outlier'] = True
-                        outlier_count += 1
-                    else:
-                        record['is_outlier'] = False
+            for record, is_outlier in zip(priced, flags):
+                record['is_outlier'] = is_outlier
+            outlier_count = sum(flags)
 
             if outlier_count > 0:
                 logger.info(f"Flagged {outlier_count} outlier records")
@@ -165,29 +176,134 @@ class DataPreprocessor:
 
         return data
 
+    @staticmethod
+    def _outlier_flags(costs: List) -> Optional[List[bool]]:
+        """Flag costs beyond 3 standard deviations of the positive costs, None if there are none"""
+        daily = np.array(costs, dtype=np.float64)
+
+        # Statistics only consider positive costs
+        positive = daily[daily > 0]
+        if not positive.size:
+            return None
+
+        # Calculate mean and standard deviation
+        mean = positive.mean()
+        std_dev = positive.std()
+
+        # Flag outliers (3 standard deviations from mean)
+        threshold_low = mean - (3 * std_dev)
+        threshold_high = mean + (3 * std_dev)
+        return ((daily < threshold_low) | (daily > threshold_high)).tolist()
+
     def enrich_data(self, data: List[Dict]) -> List[Dict]:
         """Enrich data with calculated fields"""
+        timestamp_fields = {}
         for record in data:
             try:
-                # Add human-readable timestamp
-                if 'timestamp' in record:
-                    ts = datetime.fromisoformat(record['timestamp'])
-                    record['timestamp_readable'] = ts.strftime('%Y-%m-%d %H:%M:%S')
-                    record['date'] = ts.strftime('%Y-%m-%d')
-                    record['hour'] = ts.hour
-
-                # Add cost per day/week/month if not present
-                if 'pricing' in record:
-                    pricing = record['pricing']
-                    if 'daily_cost_usd' in pricing:
-                        pricing['weekly_cost_usd'] = pricing['daily_cost_usd'] * 7
-                        pricing['yearly_cost_usd'] = pricing['daily_cost_usd'] * 365
-
+                self._enrich_record(record, timestamp_fields)
             except Exception as e:
                 logger.warning(f"Error enriching data: {e}")
 
         return data
 
+    @staticmethod
+    def _enrich_record(record: Dict, timestamp_fields: Dict[str, Tuple[str, str, int]]):
+        """Add the calculated fields to one record in place
+
+        timestamp_fields memoizes the derived fields per distinct timestamp for
+        the current batch; records of one collection run share a timestamp.
+        """
+        # Add human-readable timestamp
+        if 'timestamp' in record:
+            timestamp = record['timestamp']
+            fields = timestamp_fields.get(timestamp)
+            if fields is None:
+                fields = timestamp_fields[timestamp] = _timestamp_fields(timestamp)
+            record['timestamp_readable'], record['date'], record['hour'] = fields
+
+        # Add cost per day/week/month if not present
+        if 'pricing' in record:
+            pricing = record['pricing']
+            if 'daily_cost_usd' in pricing:
+                pricing['weekly_cost_usd'] = pricing['daily_cost_usd'] * 7
+                pricing['yearly_cost_usd'] = pricing['daily_cost_usd'] * 365
+
+    def process_records(self, data: List[Dict], key_fields: List[str],
+                        fill: bool = True, flag_outliers: bool = True) -> List[Dict]:
+        """Deduplicate, fill, outlier-flag and enrich records in two passes
+
+        Equivalent to remove_duplicate_records, fill_missing_values,
+        detect_and_flag_outliers and enrich_data in turn. The outlier thresholds
+        need every daily cost, so flags and enrichment go in a second pass.
+        """
+        getters = [_field_getter(field) for field in key_fields] if self.remove_duplicates else None
+        fill = fill and self.fill_missing
+        flag_outliers = flag_outliers and self.detect_outliers
+        now = datetime.now().isoformat()
+
+        seen = set()
+        records = []
+        # Position of each kept record's daily cost in costs, or -1 if it has none
+        cost_positions = []
+        costs = []
+
+        for record in data:
+            if getters is not None:
+                try:
+                    key = tuple([getter(record) for getter in getters])
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                except Exception as e:
+                    logger.warning(f"Error processing record for duplicate detection: {e}")
+
+            records.append(record)
+
+            if fill:
+                try:
+                    self._fill_record(record, now)
+                except Exception as e:
+                    logger.warning(f"Error filling missing values: {e}")
+
+            if flag_outliers:
+                try:
+                    if 'pricing' in record and 'daily_cost_usd' in record['pricing']:
+                        cost_positions.append(len(costs))
+                        costs.append(record['pricing']['daily_cost_usd'])
+                    else:
+                        cost_positions.append(-1)
+                except Exception as e:
+                    logger.warning(f"Error detecting outliers: {e}")
+                    flag_outliers = False
+
+        removed = len(data) - len(records)
+        if removed > 0:
+            logger.info(f"Removed {removed} duplicate records")
+
+        flags = None
+        if flag_outliers and len(records) >= 10:
+            try:
+                flags = self._outlier_flags(costs)
+            except Exception as e:
+                logger.warning(f"Error detecting outliers: {e}")
+
+        if flags is not None:
+            outlier_count = sum(flags)
+            if outlier_count > 0:
+                logger.info(f"Flagged {outlier_count} outlier records")
+
+        timestamp_fields = {}
+        for i, record in enumerate(records):
+            if flags is not None and (position := cost_positions[i]) >= 0:
+                record['is_outlier'] = flags[position]
+
+            try:
+                self._enrich_record(record, timestamp_fields)
+            except Exception as e:
+                logger.warning(f"Error enriching data: {e}")
+
+        return records
+
     def create_summary_statistics(self, costs: List[Dict]) -> Dict:
         """Create summary statistics for the dashboard"""
         if not costs:
@@ -195,24 +311,43 @@ class DataPreprocessor:
 
         try:
             total_leases = len(costs)
-            total_daily = sum(c.get('pricing', {}).get('daily_cost_usd', 0) for c in costs)
-            total_monthly = sum(c.get('pricing', {}).get('monthly_cost_usd', 0) for c in costs)
+
+            # Pull every field the summary needs in one pass over the records
+            daily_costs = []
+            monthly_costs = []
+            owners = set()
+            providers = set()
+            timestamps = []
+            for c in costs:
+                pricing = c.get('pricing', _EMPTY)
+                daily_costs.append(pricing.get('daily_cost_usd', 0))
+                monthly_costs.append(pricing.get('monthly_cost_usd', 0))
+                if c.get('deployment_id'):
+                    owners.add(c['deployment_id'].get('owner', ''))
+                if c.get('lease_id'):
+                    providers.add(c['lease_id'].get('provider', ''))
+                if 'timestamp' in c:
+                    timestamps.append(c['timestamp'])
+
+            total_daily = float(np.array(daily_costs, dtype=np.float64).sum())
+            total_monthly = float(np.array(monthly_costs, dtype=np.float64).sum())
             avg_daily = total_daily / total_leases if total_leases > 0 else 0
 
             # Get unique owners and providers
-            unique_owners = len(set(c.get('deployment_id', {}).get('owner', '') for c in costs if c.get('deployment_id')))
-            unique_providers = len(set(c.get('lease_id', {}).get('provider', '') for c in costs if c.get('lease_id')))
-
-            # Get date range
-            timestamps = [datetime.fromisoformat(c['timestamp']) for c in costs if 'timestamp' in c]
-            if timestamps:
-                min_date = min(timestamps).isoformat()
-                max_date = max(timestamps).isoformat()
+            unique_owners = len(owners)
+            unique_providers = len(providers)
+
+            # Get date range, parsing each distinct timestamp once
+            now = datetime.now().isoformat()
+            parsed = [parse_timestamp(t) for t in dict.fromkeys(timestamps)]
+            if parsed:
+                min_date = min(parsed).isoformat()
+                max_date = max(parsed).isoformat()
             else:
-                min_date = max_date = datetime.now().isoformat()
+                min_date = max_date = now
 
             return {
-                'generated_at': datetime.now().isoformat(),
+                'generated_at': now,
                 'data_range': {
                     'start': min_date,
                     'end': max_date,
@@ -236,21 +371,66 @@ class DataPreprocessor:
         output_file = self.output_path / filename
 
         try:
-            with open(output_file, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+            write_json_atomic(output_file, data, indent=self.indent, default=str)
             logger.info(f"Saved processed data to {output_file}")
         except Exception as e:
             logger.error(f"Error saving data: {e}")
 
+    def save_processed_table(self, costs: List[Dict], filename: str):
+        """Save the flat cost columns as Parquet for columnar analysis"""
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            logger.debug("pyarrow not installed, skipping Parquet output")
+            return
+
+        output_file = self.output_path / filename
+        tmp_file = output_file.with_name(output_file.name + '.tmp')
+
+        # Addresses and dates repeat heavily, so they are dictionary-encoded
+        address = pa.dictionary(pa.int32(), pa.string())
+        schema = pa.schema([
+            ('timestamp', pa.string()),
+            ('owner', address),
+            ('dseq', pa.string()),
+            ('provider', address),
+            ('daily_cost_usd', pa.float64()),
+            ('monthly_cost_usd', pa.float64()),
+            ('is_outlier', pa.bool_()),
+            ('date', address),
+            ('hour', pa.int8()),
+        ])
+
+        columns = {name: [] for name in schema.names}
+        for record in costs:
+            pricing = record.get('pricing') or _EMPTY
+            lease_id = record.get('lease_id') or _EMPTY
+            columns['timestamp'].append(record.get('timestamp'))
+            columns['owner'].append(lease_id.get('owner'))
+            dseq = lease_id.get('dseq')
+            columns['dseq'].append(None if dseq is None else str(dseq))
+            columns['provider'].append(lease_id.get('provider'))
+            columns['daily_cost_usd'].append(pricing.get('daily_cost_usd'))
+            columns['monthly_cost_usd'].append(pricing.get('monthly_cost_usd'))
+            columns['is_outlier'].append(record.get('is_outlier'))
+            columns['date'].append(record.get('date'))
+            columns['hour'].append(record.get('hour'))
+
+        try:
+            table = pa.Table.from_pydict(columns, schema=schema)
+            pq.write_table(table, tmp_file, compression='zstd', use_dictionary=True)
+            os.replace(tmp_file, output_file)
+            logger.info(f"Saved processed data to {output_file}")
+        except Exception as e:
+            tmp_file.unlink(missing_ok=True)
+            logger.error(f"Error saving Parquet data: {e}")
+
     def run(self):
         """Run the preprocessing process"""
         console.print("\n[bold blue]Akash Network - Data Preprocessor[/bold blue]\n")
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
+        with progress_spinner(console) as progress:
 
             # Load and process cost data
             task1 = progress.add_task("Loading cost data...", total=None)
@@ -258,48 +438,39 @@ class DataPreprocessor:
             progress.update(task1, completed=True)
 
             if costs:
-                task2 = progress.add_task("Removing duplicates...", total=None)
-                costs = self.remove_duplicate_records(
+                task2 = progress.add_task("Cleaning and enriching data...", total=None)
+                costs = self.process_records(
                     costs,
                     ['lease_id.owner', 'lease_id.dseq', 'lease_id.provider']
                 )
                 progress.update(task2, completed=True)
 
-                task3 = progress.add_task("Filling missing values...", total=None)
-                costs = self.fill_missing_values(costs)
-                progress.update(task3, completed=True)
-
-                task4 = progress.add_task("Detecting outliers...", total=None)
-                costs = self.detect_and_flag_outliers(costs)
-                progress.update(task4, completed=True)
-
-                task5 = progress.add_task("Enriching data...", total=None)
-                costs = self.enrich_data(costs)
-                progress.update(task5, completed=True)
-
-                task6 = progress.add_task("Creating summary...", total=None)
+                task3 = progress.add_task("Creating summary...", total=None)
                 summary = self.create_summary_statistics(costs)
-                progress.update(task6, completed=True)
+                progress.update(task3, completed=True)
 
-                task7 = progress.add_task("Saving processed data...", total=None)
+                task4 = progress.add_task("Saving processed data...", total=None)
                 self.save_processed_data(costs, 'processed_costs.json')
                 self.save_processed_data(summary, 'dashboard_summary.json')
-                progress.update(task7, completed=True)
+                if self.parquet_output:
+                    self.save_processed_table(costs, 'processed_costs.parquet')
+                progress.update(task4, completed=True)
 
             # Load and process resource data
-            task8 = progress.add_task("Loading resource data...", total=None)
+            task5 = progress.add_task("Loading resource data...", total=None)
             resources = self.load_latest_data('lease_resources')
-            progress.update(task8, completed=True)
+            progress.update(task5, completed=True)
 
             if resources:
-                task9 = progress.add_task("Processing resources...", total=None)
-                resources = self.remove_duplicate_records(
+                task6 = progress.add_task("Processing resources...", total=None)
+                resources = self.process_records(
                     resources,
-                    ['lease_id.owner', 'lease_id.dseq', 'lease_id.provider']
+                    ['lease_id.owner', 'lease_id.dseq', 'lease_id.provider'],
+                    fill=False,
+                    flag_outliers=False,
                 )
-                resources = self.enrich_data(resources)
                 self.save_processed_data(resources, 'processed_resources.json')
-                progress.update(task9, completed=True)
+                progress.update(task6, completed=True)
 
         console.print("\n[bold green]Preprocessing Complete![/bold green]\n")
         console.print(f"Processed {len(costs)} cost records")
@@ -310,7 +481,8 @@ class DataPreprocessor:
 @click.command()
 @click.option('--config', default='config.yaml', help='Path to configuration file')
 @click.option('--verbose', is_flag=True, help='Enable verbose logging')
-def main(config, verbose):
+@click.option('--pretty', is_flag=True, help='Indent the JSON output for readability')
+def main(config, verbose, pretty):
     """Preprocess and clean collected data"""
 
     # Load configuration
@@ -318,9 +490,12 @@ def main(config, verbose):
 
     # Setup logging
     if verbose:
-        cfg.config['logging']['level'] = 'DEBUG'
+        cfg.set('logging', 'level', value='DEBUG')
     setup_logging(cfg)
 
+    if pretty:
+        cfg.set('processing', 'pretty_output', value=True)
+
     # Run preprocessor
     preprocessor = DataPreprocessor(cfg)
     preprocessor.run()
@@ -0,0 +1,34 @@
+"""
+Gunicorn configuration for serving the Akalysis API in production
+
+Usage (from the data/ directory):
+    gunicorn -c gunicorn.conf.py api_server:application
+"""
+
+import multiprocessing
+import os
+
+bind = os.environ.get('AKALYSIS_API_BIND', '0.0.0.0:5000')
+
+# Threaded workers: requests are mostly cache hits and network I/O
+worker_class = 'gthread'
+workers = int(os.environ.get('AKALYSIS_API_WORKERS', multiprocessing.cpu_count()))
+threads = int(os.environ.get('AKALYSIS_API_THREADS', 4))
+
+# Import the app once in the master so workers share its memory copy-on-write
+preload_app = True
+
+accesslog = '-'
+errorlog = '-'
+
+
+def when_ready(server):
+    """Parse the data files once in the master so every worker starts with a warm cache"""
+    import api_server
+    api_server.refresh_cache()
+
+
+def post_fork(server, worker):
+    """Threads do not survive fork, so each worker starts its own cache refresher"""
+    import api_server
+    api_server.start_background_refresh(warm=False)
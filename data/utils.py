@@ -4,15 +4,35 @@ Utility functions for Akash Network data collection
 
 import os
 import json
+import hashlib
 import yaml
+import numpy as np
 import time
+import threading
+import atexit
+import queue
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Any
 from loguru import logger
 import sys
 
+try:
+    import orjson
+except ImportError:  # Fall back to the standard json module if orjson is missing
+    orjson = None
+
+try:
+    import fcntl
+except ImportError:  # Not on Windows; the snapshot index is then only locked per process
+    fcntl = None
+
 
 class Config:
     """Configuration loader and manager"""
@@ -20,6 +40,7 @@ class Config:
     def __init__(self, config_path: str = "config.yaml"):
         self.config_path = config_path
         self.config = self.load_config()
+        self._flat = self._flatten(self.config)
 
     def load_config(self) -> Dict:
         """Load configuration from YAML file"""
@@ -30,20 +51,49 @@ class Config:
             logger.error(f"Config file not found: {self.config_path}")
             return {}
 
+    @staticmethod
+    def _flatten(config: Any) -> Dict[Tuple, Any]:
+        """Map every key path in the config, including intermediate sections, to its value"""
+        flat = {(): config}
+        stack = [((), config)]
+        while stack:
+            prefix, section = stack.pop()
+            if not isinstance(section, dict):
+                continue
+            for key, value in section.items():
+                path = prefix + (key,)
+                flat[path] = value
+                stack.append((path, value))
+        return flat
+
     def get(self, *keys, default=None):
         """Get nested configuration value"""
-        value = self.config
-        for key in keys:
-            if isinstance(value, dict):
-                value = value.get(key, default)
-            else:
-                return default
-        return value
+        return self._flat.get(keys, default)
+
+    def set(self, *keys, value):
+        """Set a nested configuration value, creating missing sections"""
+        if not isinstance(self.config, dict):
+            self.config = {}
+        section = self.config
+        for key in keys[:-1]:
+            if not isinstance(section.get(key), dict):
+                section[key] = {}
+            section = section[key]
+        section[keys[-1]] = value
+        self._flat = self._flatten(self.config)
 
 
 class AkashAPIClient:
     """Client for interacting with Akash Network REST API"""
 
+    # Full paginated results shared by every client in the process, so collectors
+    # run one after another fetch an endpoint such as leases only once
+    _page_cache: Dict[Tuple[str, int], Tuple[float, List[Dict]]] = {}
+    _page_cache_lock = threading.Lock()
+
+    # Keys that hold the items of paginated list responses
+    _ITEM_KEYS = ('deployments', 'leases', 'providers', 'orders', 'bids')
+
     def __init__(self, config: Config):
         self.config = config
         self.rest_apis = config.get('akash', 'rest_api', default=[])
@@ -52,9 +102,57 @@ class AkashAPIClient:
         self.retry_delay = config.get('akash', 'retry_delay', default=2)
         self.current_api_index = 0
 
-        # Rate limiting
-        self.last_request_time = 0
-        self.min_request_interval = 1.0 / config.get('rate_limiting', 'requests_per_second', default=5)
+        # Rate limiting: a token bucket holding up to one second of requests,
+        # shared by every thread using this client
+        self.requests_per_second = config.get('rate_limiting', 'requests_per_second', default=5)
+        self._bucket_capacity = max(self.requests_per_second, 1)
+        self._tokens = self._bucket_capacity
+        self._last_refill = time.monotonic()
+        self._rate_lock = threading.Lock()
+
+        # Optional on-disk cache of successful responses, for reruns during development
+        self.cache_dir = None
+        self.cache_ttl = config.get('akash', 'page_cache', 'ttl', default=3600)
+        if config.get('akash', 'page_cache', 'enabled', default=False):
+            self.cache_dir = Path(config.get('akash', 'page_cache', 'path', default='./.api_cache'))
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.shared_ttl = config.get('akash', 'page_cache', 'shared_ttl', default=60)
+
+        # Pagination limits
+        self.max_pages = config.get('collection', 'max_pages', default=100)
+        self.max_workers = config.get('collection', 'max_workers', default=8)
+
+        # One keep-alive session for every request, so paginated fetches reuse their
+        # TCP/TLS connections. The pool is sized for the parallel page fetchers
+        pool_size = max(self.max_workers, 1)
+        adapter = HTTPAdapter(pool_connections=max(len(self.rest_apis), 1), pool_maxsize=pool_size)
+        self.session = requests.Session()
+        self.session.headers['Accept'] = 'application/json'
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        # Hedged requests: when the current endpoint has not answered within
+        # hedge_delay seconds, the same request also goes to the next mirror and
+        # the first good response wins. A mirror that fails is not hedged to
+        # again until mirror_cooldown seconds have passed
+        self.hedge_delay = config.get('akash', 'hedge_delay', default=0)
+        self.mirror_cooldown = config.get('akash', 'mirror_cooldown', default=60)
+        self._mirror_down_until: Dict[str, float] = {}
+        self._hedge_pool = None
+        if self.hedge_delay and len(self.rest_apis) > 1:
+            self._hedge_pool = ThreadPoolExecutor(max_workers=2 * pool_size)
+
+    def close(self):
+        """Close the pooled connections"""
+        if self._hedge_pool is not None:
+            self._hedge_pool.shutdown(wait=False)
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
 
     def get_current_api(self) -> str:
         """Get the current REST API endpoint"""
@@ -69,13 +167,53 @@ class AkashAPIClient:
 
     def _rate_limit(self):
         """Apply rate limiting"""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.min_request_interval:
-            time.sleep(self.min_request_interval - elapsed)
-        self.last_request_time = time.time()
+        # Take a token under the lock, then sleep outside it. An empty bucket goes
+        # into debt, so concurrent callers queue up behind each other
+        with self._rate_lock:
+            now = time.monotonic()
+            self._tokens = min(self._bucket_capacity,
+                               self._tokens + (now - self._last_refill) * self.requests_per_second)
+            self._last_refill = now
+            self._tokens -= 1
+            wait = -self._tokens / self.requests_per_second if self._tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+    def _cache_path(self, endpoint: str, params: Optional[Dict]) -> Optional[Path]:
+        """Path of the cached response for a request, or None when caching is off"""
+        if self.cache_dir is None:
+            return None
+        key = json.dumps([endpoint, params], sort_keys=True, default=str)
+        return self.cache_dir / f"{hashlib.sha1(key.encode()).hexdigest()}.json"
+
+    def _load_cached(self, cache_path: Path) -> Optional[Dict]:
+        """Return a cached response if it is younger than the cache TTL"""
+        try:
+            if time.time() - cache_path.stat().st_mtime > self.cache_ttl:
+                return None
+            return loads_json(cache_path.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def _store_cached(self, cache_path: Path, content: bytes):
+        """Save a raw response body, swapping it into place so readers never see a partial file"""
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{threading.get_ident()}.tmp")
+        try:
+            tmp_path.write_bytes(content)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f"Failed to cache response: {e}")
+            tmp_path.unlink(missing_ok=True)
 
     def request(self, endpoint: str, params: Optional[Dict] = None) -> Optional[Dict]:
         """Make a request to Akash API with retry logic"""
+        cache_path = self._cache_path(endpoint, params)
+        if cache_path is not None:
+            cached = self._load_cached(cache_path)
+            if cached is not None:
+                logger.debug(f"Cache hit for {endpoint} {params}")
+                return cached
+
         self._rate_limit()
 
         for attempt in range(self.max_retries):
@@ -85,15 +223,12 @@ class AkashAPIClient:
 
                 logger.debug(f"Request to {url} (attempt {attempt + 1}/{self.max_retries})")
 
-                response = requests.get(
-                    url,
-                    params=params,
-                    timeout=self.timeout,
-                    headers={'Accept': 'application/json'}
-                )
+                response = self._get(base_url, endpoint, params)
 
                 if response.status_code == 200:
-                    return response.json()
+                    if cache_path is not None:
+                        self._store_cached(cache_path, response.content)
+                    return loads_json(response.content)
                 elif response.status_code == 503:
                     logger.warning(f"API unavailable (503), switching endpoint...")
                     self.switch_api()
@@ -116,52 +251,355 @@ class AkashAPIClient:
         logger.error(f"Failed to fetch data after {self.max_retries} attempts")
         return None
 
-    def paginated_request(self, endpoint: str, page_size: int = 100) -> List[Dict]:
+    def _fetch(self, base_url: str, endpoint: str, params: Optional[Dict]) -> requests.Response:
+        """GET one endpoint, noting whether it is healthy enough to hedge to"""
+        try:
+            response = self.session.get(f"{base_url}{endpoint}", params=params, timeout=self.timeout)
+        except requests.exceptions.RequestException:
+            self._mirror_down_until[base_url] = time.monotonic() + self.mirror_cooldown
+            raise
+        if response.status_code >= 500:
+            self._mirror_down_until[base_url] = time.monotonic() + self.mirror_cooldown
+        else:
+            self._mirror_down_until.pop(base_url, None)
+        return response
+
+    def _hedge_mirror(self, base_url: str) -> Optional[str]:
+        """Next endpoint after base_url that is not cooling down, if any"""
+        now = time.monotonic()
+        start = self.rest_apis.index(base_url) if base_url in self.rest_apis else self.current_api_index
+        for offset in range(1, len(self.rest_apis)):
+            mirror = self.rest_apis[(start + offset) % len(self.rest_apis)]
+            if self._mirror_down_until.get(mirror, 0) <= now:
+                return mirror
+        return None
+
+    def _get(self, base_url: str, endpoint: str, params: Optional[Dict]) -> requests.Response:
+        """GET from base_url, hedging to a mirror when it is slow to answer"""
+        if self._hedge_pool is None:
+            return self._fetch(base_url, endpoint, params)
+
+        primary = self._hedge_pool.submit(self._fetch, base_url, endpoint, params)
+        try:
+            return primary.result(timeout=self.hedge_delay)
+        except FuturesTimeout:
+            pass
+
+        mirror = self._hedge_mirror(base_url)
+        if mirror is None:
+            return primary.result()
+        logger.debug(f"No response from {base_url} after {self.hedge_delay}s, hedging to {mirror}")
+        # The hedge is a real extra request, so it takes a rate-limit token too
+        self._rate_limit()
+        hedge = self._hedge_pool.submit(self._fetch, mirror, endpoint, params)
+
+        # First good response wins; otherwise report the primary's outcome. The
+        # losing request cannot be cancelled once sent and finishes in the background
+        for future in as_completed((primary, hedge)):
+            if future.exception() is None and future.result().status_code == 200:
+                return future.result()
+        return primary.result()
+
+    @classmethod
+    def _response_key(cls, endpoint: str, response: Dict) -> Optional[str]:
+        """Key holding the items in an endpoint's paginated responses"""
+        # List endpoints are named after their items: .../deployments/list, .../providers
+        segments = endpoint.rstrip('/').split('/')
+        name = segments[-2] if segments[-1] == 'list' and len(segments) > 1 else segments[-1]
+        if name in response:
+            return name
+        return next((key for key in cls._ITEM_KEYS if key in response), None)
+
+    @classmethod
+    def _page_items(cls, response: Dict, key: Optional[str] = None) -> List[Dict]:
+        """Extract the list of items from a paginated response"""
+        if key is None:
+            key = next((k for k in cls._ITEM_KEYS if k in response), None)
+        return (response.get(key) or []) if key is not None else []
+
+    def paginated_request(self, endpoint: str, page_size: int = 100,
+                          response_key: Optional[str] = None) -> List[Dict]:
         """Make paginated requests to collect all data"""
+        shared = self._shared_result(endpoint, page_size)
+        if shared is not None:
+            return shared
+
         all_data = []
-        page_key = None
-        max_pages = self.config.get('collection', 'max_pages', default=100)
-        page_count = 0
-
-        while page_count < max_pages:
-            params = {'pagination.limit': page_size}
-            if page_key:
-                params['pagination.key'] = page_key
-
-            response = self.request(endpoint, params)
-
-            if not response:
-                break
-
-            # Handle different response structures
-            data_items = []
-            if 'deployments' in response:
-                data_items = response['deployments']
-            elif 'leases' in response:
-                data_items = response['leases']
-            elif 'providers' in response:
-                data_items = response['providers']
-            elif 'orders' in response:
-                data_items = response['orders']
-            elif 'bids' in response:
-                data_items = response['bids']
-
-            if data_items:
-                all_data.extend(data_items)
-                logger.info(f"Fetched {len(data_items)} items (page {page_count + 1})")
-
-            # Check for next page
-            pagination = response.get('pagination', {})
-            next_key = pagination.get('next_key')
-
-            if not next_key or next_key == page_key:
-                break
-
-            page_key = next_key
-            page_count += 1
+        for items in self._fetch_pages(endpoint, page_size, response_key):
+            all_data.extend(items)
 
         logger.info(f"Total items fetched: {len(all_data)}")
-        return all_data
+        if self.shared_ttl > 0 and all_data:
+            with self._page_cache_lock:
+                self._page_cache[(endpoint, page_size)] = (time.monotonic(), all_data)
+        return list(all_data) if self.shared_ttl > 0 else all_data
+
+    def _shared_result(self, endpoint: str, page_size: int) -> Optional[List[Dict]]:
+        """Return a copy of a full result fetched earlier in this process, if still fresh"""
+        if self.shared_ttl <= 0:
+            return None
+        with self._page_cache_lock:
+            cached = self._page_cache.get((endpoint, page_size))
+        if cached is None or time.monotonic() - cached[0] > self.shared_ttl:
+            return None
+        logger.info(f"Reusing {len(cached[1])} items fetched earlier from {endpoint}")
+        return list(cached[1])
+
+    def iter_pages(self, endpoint: str, page_size: int = 100,
+                   response_key: Optional[str] = None) -> Iterator[List[Dict]]:
+        """Yield the items of each page in order, without holding every page in memory"""
+        shared = self._shared_result(endpoint, page_size)
+        if shared is not None:
+            yield shared
+            return
+        yield from self._fetch_pages(endpoint, page_size, response_key)
+
+    def _fetch_pages(self, endpoint: str, page_size: int,
+                     response_key: Optional[str] = None) -> Iterator[List[Dict]]:
+        """Fetch pages from the API, in parallel by offset when the node reports a total"""
+        max_pages = self.max_pages
+        max_workers = self.max_workers
+
+        # Ask for the total on the first page so the rest can be fetched by offset in parallel
+        response = self.request(endpoint, {'pagination.limit': page_size, 'pagination.count_total': 'true'})
+        if not response:
+            return
+
+        # Every page of an endpoint has the same shape, so find the items key once
+        key = response_key or self._response_key(endpoint, response)
+        items = self._page_items(response, key)
+        logger.info(f"Fetched {len(items)} items (page 1)")
+        yield items
+
+        pagination = response.get('pagination') or {}
+        next_key = pagination.get('next_key')
+        total = int(pagination.get('total') or 0)
+
+        if next_key and total > page_size and max_workers > 1:
+            pages = min(-(-total // page_size), max_pages)
+
+            def fetch_page(page: int) -> List[Dict]:
+                params = {'pagination.limit': page_size, 'pagination.offset': page * page_size}
+                page_response = self.request(endpoint, params)
+                items = self._page_items(page_response, key) if page_response else []
+                logger.info(f"Fetched {len(items)} items (page {page + 1}/{pages})")
+                return items
+
+            # Keep a bounded window of pages in flight and yield them in API order
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                in_flight = deque()
+                for page in range(1, pages):
+                    in_flight.append(executor.submit(fetch_page, page))
+                    if len(in_flight) >= max_workers * 2:
+                        yield in_flight.popleft().result()
+                while in_flight:
+                    yield in_flight.popleft().result()
+        else:
+            yield from self._iter_pages_by_key(endpoint, page_size, next_key, max_pages - 1, key)
+
+    def _iter_pages_by_key(self, endpoint: str, page_size: int, page_key: Optional[str],
+                           max_pages: int, key: Optional[str] = None) -> Iterator[List[Dict]]:
+        """Follow next_key links, for nodes that do not report a total
+
+        Each page's next_key is known as soon as it arrives, so the next request
+        is sent before the page is handed to the caller and runs while it is
+        being processed.
+        """
+        if not page_key or max_pages <= 0:
+            return
+
+        def fetch_page(key: str) -> Optional[Dict]:
+            return self.request(endpoint, {'pagination.limit': page_size, 'pagination.key': key})
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = executor.submit(fetch_page, page_key)
+            page_count = 0
+
+            while pending is not None:
+                response = pending.result()
+                if not response:
+                    break
+                page_count += 1
+
+                # Check for next page and prefetch it
+                pagination = response.get('pagination', {})
+                next_key = pagination.get('next_key')
+                pending = None
+                if next_key and next_key != page_key and page_count < max_pages:
+                    pending = executor.submit(fetch_page, next_key)
+                page_key = next_key
+
+                data_items = self._page_items(response, key)
+                if data_items:
+                    logger.info(f"Fetched {len(data_items)} items (page {page_count + 1})")
+                    yield data_items
+
+
+# Index file, kept next to the snapshots, naming the newest snapshot saved under each filename,
+# and the file locked while a process updates it
+_LATEST_INDEX = '.latest_snapshots.json'
+_LATEST_INDEX_LOCK = '.latest_snapshots.lock'
+
+
+@contextmanager
+def _file_lock(path: Path):
+    """Hold an exclusive lock on path, shared by every process using the same file"""
+    if fcntl is None:
+        yield
+        return
+    with open(path, 'a') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+# Schema metadata marking a Parquet or Arrow snapshot that holds a single object rather than a list
+_SINGLE_OBJECT_KEY = b'akalysis.single_object'
+
+
+def _records_table(pa, records: List[Dict]):
+    """Build an Arrow table from records, with columns for the keys of every record"""
+    # Table.from_pylist takes its columns from the first record only and drops
+    # keys that first appear later; inferring a struct over all rows keeps them
+    return pa.Table.from_struct_array(pa.array(records))
+
+
+def _table_records(table) -> Any:
+    """Records of a snapshot table, or the single object it was saved from"""
+    records = table.to_pylist()
+    if (table.schema.metadata or {}).get(_SINGLE_OBJECT_KEY) == b'1':
+        return records[0] if records else None
+    return records
+
+
+class _ParquetBatchWriter:
+    """Write batches of records to a Parquet file, giving up if a batch changes the schema"""
+
+    def __init__(self, filepath: Path):
+        self.filepath = filepath
+        self._tmp_path = filepath.with_name(filepath.name + '.tmp')
+        self._writer = None
+        self._failed = False
+
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            self._pa, self._pq = pa, pq
+        except ImportError:
+            logger.debug("pyarrow not installed, skipping Parquet copy")
+            self._failed = True
+
+    def write(self, records: List[Dict]):
+        if self._failed or not records:
+            return
+        try:
+            table = _records_table(self._pa, records)
+            if self._writer is None:
+                self._writer = self._pq.ParquetWriter(self._tmp_path, table.schema, compression='zstd')
+            elif table.schema != self._writer.schema:
+                table = table.cast(self._writer.schema)
+            self._writer.write_table(table)
+        except Exception as e:
+            # The JSON snapshot is authoritative; readers fall back to it
+            logger.warning(f"Failed to save Parquet copy: {e}")
+            self.abort()
+
+    def close(self):
+        if self._failed or self._writer is None:
+            return
+        try:
+            self._writer.close()
+            os.replace(self._tmp_path, self.filepath)
+            logger.info(f"Data saved to {self.filepath}")
+        except Exception as e:
+            logger.warning(f"Failed to save Parquet copy: {e}")
+            self.abort()
+
+    def abort(self):
+        self._failed = True
+        if self._writer is not None:
+            try:
+                self._writer.close()
+            except Exception:
+                pass
+            self._writer = None
+        self._tmp_path.unlink(missing_ok=True)
+
+
+class JsonArrayWriter:
+    """Stream records into a JSON array file batch by batch, swapping it into place on close"""
+
+    def __init__(self, filepath: Path, parquet_sidecar: bool = False,
+                 on_close: Optional[Callable[[Path], None]] = None):
+        self.filepath = filepath
+        self.count = 0
+        self._on_close = on_close
+        self._tmp_path = filepath.with_name(filepath.name + '.tmp')
+        self._file = open(self._tmp_path, 'wb')
+        self._file.write(b'[')
+        self._parquet = _ParquetBatchWriter(filepath.with_suffix('.parquet')) if parquet_sidecar else None
+
+    def write_many(self, records: List[Dict]):
+        """Append a batch of records"""
+        if records:
+            # Serialize the whole batch, then write it in one call
+            body = b',\n  '.join([dumps_json(record, default=str) for record in records])
+            self._file.write((b',\n  ' if self.count else b'\n  ') + body)
+            self.count += len(records)
+        if self._parquet is not None:
+            self._parquet.write(records)
+
+    def close(self):
+        """Finish the array and swap the file into place"""
+        self._file.write(b'\n]' if self.count else b']')
+        self._file.close()
+        os.replace(self._tmp_path, self.filepath)
+        logger.info(f"Data saved to {self.filepath}")
+        # Written after the JSON, so readers see it as at least as new
+        if self._parquet is not None:
+            self._parquet.close()
+        if self._on_close is not None:
+            self._on_close(self.filepath)
+
+    def abort(self):
+        """Discard everything written so far"""
+        self._file.close()
+        self._tmp_path.unlink(missing_ok=True)
+        if self._parquet is not None:
+            self._parquet.abort()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class _BufferedWriter:
+    """Collect streamed records and save them in one call, for backends that cannot stream"""
+
+    def __init__(self, storage: 'DataStorage', filename: str):
+        self.storage = storage
+        self.filename = filename
+        self.records: List[Dict] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.records)
+
+    def write_many(self, records: List[Dict]):
+        self.records.extend(records)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.storage.save(self.records, self.filename)
 
 
 class DataStorage:
@@ -172,13 +610,80 @@ class DataStorage:
         self.backend = config.get('storage', 'backend', default='json')
         self.base_path = Path(config.get('storage', 'file', 'base_path', default='./collected_data'))
         self.base_path.mkdir(parents=True, exist_ok=True)
+        self.parquet_sidecar = config.get('storage', 'file', 'parquet_sidecar', default=True)
+        # Compact snapshots unless pretty-printing is asked for
+        self.indent = 2 if config.get('storage', 'file', 'pretty_json', default=False) else None
+        # Name of the newest snapshot per filename, so load_latest need not scan the directory
+        self._index_path = self.base_path / _LATEST_INDEX
+        self._index = self._read_index()
+        self._index_lock = threading.Lock()
+
+        # Snapshot names: the save time, formatted at most once a second, then a
+        # sequence number that restarts each second, then the process id so
+        # processes saving in the same second never overwrite each other
+        self._stamp: Tuple[int, str, int] = (0, '', 0)
+        self._stamp_lock = threading.Lock()
+
+        # Saves are handed to a writer thread so collectors do not wait on disk
+        self.background_writes = config.get('storage', 'file', 'background_writes', default=True)
+        self._queue: Optional[queue.Queue] = None
+
+    def _snapshot_path(self, filename: str, extension: str) -> Path:
+        """Path for a new snapshot, named so that newer snapshots sort after older ones"""
+        second = int(time.time())
+        with self._stamp_lock:
+            if self._stamp[0] == second:
+                self._stamp = (second, self._stamp[1], self._stamp[2] + 1)
+            else:
+                self._stamp = (second, datetime.fromtimestamp(second).strftime('%Y%m%d_%H%M%S'), 0)
+            _, stamp, sequence = self._stamp
+        return self.base_path / f"{filename}_{stamp}_{sequence:04d}_{os.getpid()}.{extension}"
 
     def save(self, data: Any, filename: str, data_type: str = 'collection'):
-        """Save data to configured backend"""
+        """Save data to configured backend
+
+        With background writes on, this returns once the save is queued, so the
+        data must not be modified afterwards; call flush() to wait for it.
+        """
+        if not self.background_writes:
+            self._write(data, filename)
+            return
+        if self._queue is None:
+            self._start_writer()
+        self._queue.put((data, filename))
+
+    def _start_writer(self):
+        """Start the writer thread, draining its queue before the interpreter exits"""
+        self._queue = queue.Queue(maxsize=16)
+        threading.Thread(target=self._writer_loop, name='storage-writer', daemon=True).start()
+        atexit.register(self.flush)
+
+    def _writer_loop(self):
+        """Write queued saves in order"""
+        while True:
+            data, filename = self._queue.get()
+            try:
+                self._write(data, filename)
+            except Exception as e:
+                logger.error(f"Failed to save {filename}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def flush(self):
+        """Wait until every queued save has been written"""
+        if self._queue is not None:
+            self._queue.join()
+
+    def _write(self, data: Any, filename: str):
+        """Save data to configured backend, on the calling thread"""
         if self.backend == 'json':
             self._save_json(data, filename)
         elif self.backend == 'csv':
             self._save_csv(data, filename)
+        elif self.backend == 'parquet':
+            self._save_parquet_snapshot(data, filename)
+        elif self.backend == 'arrow':
+            self._save_arrow_snapshot(data, filename)
         elif self.backend == 'mongodb':
             self._save_mongodb(data, filename)
         elif self.backend == 'postgresql':
@@ -186,25 +691,154 @@ class DataStorage:
         else:
             logger.error(f"Unknown storage backend: {self.backend}")
 
+    def open_stream(self, filename: str):
+        """Open a writer that saves records batch by batch instead of from one full list"""
+        if self.backend == 'json':
+            # Keep snapshots of one name in save order
+            self.flush()
+            return JsonArrayWriter(self._snapshot_path(filename, 'json'), self.parquet_sidecar,
+                                   on_close=lambda filepath: self._record_latest(filename, filepath))
+        return _BufferedWriter(self, filename)
+
     def _save_json(self, data: Any, filename: str):
         """Save data as JSON"""
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filepath = self.base_path / f"{filename}_{timestamp}.json"
+        filepath = self._snapshot_path(filename, 'json')
 
         try:
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+            write_json_atomic(filepath, data, indent=self.indent, default=str)
             logger.info(f"Data saved to {filepath}")
         except Exception as e:
             logger.error(f"Failed to save JSON: {e}")
+            return
+        self._record_latest(filename, filepath)
+
+        if self.parquet_sidecar and isinstance(data, list) and data and isinstance(data[0], dict):
+            self._save_parquet(data, filepath.with_suffix('.parquet'))
+
+    def _save_parquet(self, records: List[Dict], filepath: Path):
+        """Save records as a columnar Parquet copy next to their JSON snapshot"""
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            logger.debug("pyarrow not installed, skipping Parquet copy")
+            return
+
+        try:
+            tmp_path = filepath.with_name(filepath.name + '.tmp')
+            pq.write_table(_records_table(pa, records), tmp_path, compression='zstd')
+            os.replace(tmp_path, filepath)
+            logger.info(f"Data saved to {filepath}")
+        except Exception as e:
+            # The JSON snapshot is authoritative; readers fall back to it
+            logger.warning(f"Failed to save Parquet copy: {e}")
+
+    def _save_parquet_snapshot(self, data: Any, filename: str):
+        """Save data as a Parquet snapshot, falling back to JSON when Parquet cannot hold it"""
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            logger.warning("pyarrow not installed, saving JSON instead of Parquet")
+            self._save_json(data, filename)
+            return
+
+        filepath = self._snapshot_path(filename, 'parquet')
+        tmp_path = filepath.with_name(filepath.name + '.tmp')
+
+        # A single object is stored as a one-row table and flagged so it loads back as one
+        single = isinstance(data, dict)
+        records = [data] if single else data
+
+        try:
+            table = _records_table(pa, records)
+            table = table.replace_schema_metadata({_SINGLE_OBJECT_KEY: b'1' if single else b'0'})
+            pq.write_table(table, tmp_path, compression='zstd', use_dictionary=True)
+            os.replace(tmp_path, filepath)
+            logger.info(f"Data saved to {filepath}")
+        except Exception as e:
+            tmp_path.unlink(missing_ok=True)
+            logger.warning(f"Failed to save Parquet ({e}), saving JSON instead")
+            self._save_json(data, filename)
+            return
+        self._record_latest(filename, filepath)
+
+    @staticmethod
+    def snapshot_buffer(data: Any):
+        """Serialize records, or a single object, to an Arrow IPC stream in memory
+
+        Readers get the columns without a parsing pass, and numeric columns can
+        be viewed without copying: pa.ipc.open_stream(buffer).read_all().
+        """
+        import pyarrow as pa
+
+        single = isinstance(data, dict)
+        table = _records_table(pa, [data] if single else data)
+        table = table.replace_schema_metadata({_SINGLE_OBJECT_KEY: b'1' if single else b'0'})
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue()
+
+    def _save_arrow_snapshot(self, data: Any, filename: str):
+        """Save data as an Arrow IPC stream snapshot, falling back to JSON when pyarrow is missing"""
+        try:
+            buffer = self.snapshot_buffer(data)
+        except ImportError:
+            logger.warning("pyarrow not installed, saving JSON instead of Arrow")
+            self._save_json(data, filename)
+            return
+        except Exception as e:
+            logger.warning(f"Failed to build Arrow snapshot ({e}), saving JSON instead")
+            self._save_json(data, filename)
+            return
+
+        filepath = self._snapshot_path(filename, 'arrow')
+        tmp_path = filepath.with_name(filepath.name + '.tmp')
+        try:
+            tmp_path.write_bytes(memoryview(buffer))
+            os.replace(tmp_path, filepath)
+            logger.info(f"Data saved to {filepath}")
+        except OSError as e:
+            tmp_path.unlink(missing_ok=True)
+            logger.error(f"Failed to save Arrow snapshot: {e}")
+            return
+        self._record_latest(filename, filepath)
+
+    def _read_index(self) -> Dict[str, str]:
+        """Read the latest-snapshot index, treating a missing or damaged one as empty"""
+        try:
+            index = loads_json(self._index_path.read_bytes())
+        except (OSError, ValueError):
+            return {}
+        return index if isinstance(index, dict) else {}
+
+    def _record_latest(self, filename: str, filepath: Path):
+        """Record filepath as the newest snapshot saved under filename"""
+        # Merge with the index on disk, which other collectors may have updated since.
+        # The file lock keeps concurrent collector processes from dropping each
+        # other's entries between the read and the write
+        try:
+            with self._index_lock, _file_lock(self.base_path / _LATEST_INDEX_LOCK):
+                self._index = self._read_index()
+                current = self._index.get(filename)
+                # Names sort by age, so never replace a newer entry with an older one
+                if current is None or filepath.name > current:
+                    self._index[filename] = filepath.name
+                    write_json_atomic(self._index_path, self._index)
+        except OSError as e:
+            logger.warning(f"Failed to update snapshot index: {e}")
 
     def _save_csv(self, data: Any, filename: str):
         """Save data as CSV"""
         try:
             import pandas as pd
 
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filepath = self.base_path / f"{filename}_{timestamp}.csv"
+            filepath = self._snapshot_path(filename, 'csv')
+
+            if isinstance(data, list) and data and self._write_flat_csv(data, filepath):
+                logger.info(f"Data saved to {filepath}")
+                return
 
             if isinstance(data, list):
                 df = pd.DataFrame(data)
@@ -218,24 +852,50 @@ class DataStorage:
         except Exception as e:
             logger.error(f"Failed to save CSV: {e}")
 
+    @staticmethod
+    def _write_flat_csv(records: List[Dict], filepath: Path) -> bool:
+        """Write flat records with pyarrow's multi-threaded CSV writer
+
+        Returns False, writing nothing, when pyarrow is missing or a column holds
+        nested values, which pyarrow cannot write as CSV.
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pa_csv
+        except ImportError:
+            return False
+
+        try:
+            table = _records_table(pa, records)
+        except (pa.ArrowException, TypeError, ValueError):
+            return False
+        if any(pa.types.is_nested(field.type) for field in table.schema):
+            return False
+        pa_csv.write_csv(table, filepath)
+        return True
+
     def _save_mongodb(self, data: Any, collection_name: str):
         """Save data to MongoDB"""
         try:
-            from pymongo import MongoClient
+            from pymongo import ReplaceOne
 
             conn_str = self.config.get('storage', 'mongodb', 'connection_string')
             db_name = self.config.get('storage', 'mongodb', 'database')
 
-            client = MongoClient(conn_str)
-            db = client[db_name]
-            collection = db[collection_name]
+            collection = _mongo_client(conn_str)[db_name][collection_name]
 
-            if isinstance(data, list):
-                result = collection.insert_many(data)
-                logger.info(f"Inserted {len(result.inserted_ids)} documents to MongoDB")
-            else:
-                result = collection.insert_one(data)
-                logger.info(f"Inserted document to MongoDB: {result.inserted_id}")
+            # Upsert by a stable id, so saving the same snapshot twice stores it once,
+            # and unordered so one failing document does not abort the rest
+            documents = data if isinstance(data, list) else [data]
+            written = 0
+            for start in range(0, len(documents), _MONGO_BATCH_SIZE):
+                operations = [
+                    ReplaceOne({'_id': _document_id(doc)}, doc, upsert=True)
+                    for doc in documents[start:start + _MONGO_BATCH_SIZE]
+                ]
+                result = collection.bulk_write(operations, ordered=False)
+                written += result.upserted_count + result.matched_count
+            logger.info(f"Saved {written} documents to MongoDB")
 
         except Exception as e:
             logger.error(f"Failed to save to MongoDB: {e}")
@@ -247,15 +907,117 @@ class DataStorage:
 
     def load_latest(self, filename_pattern: str) -> Optional[Any]:
         """Load the most recent data file matching pattern"""
+        self.flush()
         try:
-            files = sorted(self.base_path.glob(f"{filename_pattern}_*.json"), reverse=True)
+            # Re-read the index, since other collectors may have saved since this instance started
+            with self._index_lock:
+                self._index = self._read_index()
+            name = self._index.get(filename_pattern)
+            if name is not None:
+                latest = self.base_path / name
+                if latest.is_file():
+                    return self._load_snapshot(latest)
+
+            # Not saved through the index (or since removed): scan the directory
+            files = list(self.base_path.glob(f"{filename_pattern}_*.json"))
+            if self.backend in ('parquet', 'arrow'):
+                files.extend(self.base_path.glob(f"{filename_pattern}_*.{self.backend}"))
             if files:
-                with open(files[0], 'r') as f:
-                    return json.load(f)
+                # Snapshot names end in a sortable timestamp; on a tie prefer the JSON
+                latest = max(files, key=lambda f: (f.stem, f.suffix == '.json'))
+                return self._load_snapshot(latest)
         except Exception as e:
             logger.error(f"Failed to load data: {e}")
         return None
 
+    def _load_snapshot(self, filepath: Path) -> Any:
+        """Load a JSON, Parquet or Arrow snapshot"""
+        if filepath.suffix == '.parquet':
+            return self._load_parquet_snapshot(filepath)
+        if filepath.suffix == '.arrow':
+            return self._load_arrow_snapshot(filepath)
+        return loads_json(filepath.read_bytes())
+
+    @staticmethod
+    def _load_parquet_snapshot(filepath: Path) -> Any:
+        """Load a Parquet snapshot saved by the parquet backend"""
+        import pyarrow.parquet as pq
+
+        return _table_records(pq.read_table(filepath))
+
+    @staticmethod
+    def _load_arrow_snapshot(filepath: Path) -> Any:
+        """Load an Arrow IPC snapshot saved by the arrow backend"""
+        import pyarrow as pa
+
+        with pa.memory_map(str(filepath)) as source:
+            return _table_records(pa.ipc.open_stream(source).read_all())
+
+
+# Documents sent to MongoDB per bulk write
+_MONGO_BATCH_SIZE = 1000
+
+
+@lru_cache(maxsize=None)
+def _mongo_client(conn_str: str):
+    """Shared MongoClient per connection string, so every save reuses its connection pool"""
+    from pymongo import MongoClient
+    return MongoClient(conn_str, maxPoolSize=50)
+
+
+def _document_id(document: Dict) -> Any:
+    """MongoDB _id for a document: its own id, or a hash of its content"""
+    if document.get('_id') is not None:
+        return document['_id']
+    if document.get('id') is not None:
+        return document['id']
+    key = json.dumps(document, sort_keys=True, default=str)
+    return hashlib.sha1(key.encode()).hexdigest()
+
+
+def loads_json(content: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(content)
+    # json.loads detects the UTF encoding of bytes itself, without decoding to text first
+    return json.loads(content)
+
+
+@lru_cache(maxsize=4096)
+def parse_timestamp(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp, memoized because every record of a collection batch shares one"""
+    return datetime.fromisoformat(value)
+
+
+def dumps_json(data: Any, indent: Optional[int] = None, default=None) -> bytes:
+    """Serialize data to JSON bytes, using orjson when available"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            # orjson only supports two-space indentation
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=default, option=option)
+    return json.dumps(data, indent=indent, default=default).encode()
+
+
+def write_json_atomic(filepath: Path, data: Any, indent: Optional[int] = None, default=None):
+    """Write JSON to a temporary file and swap it into place, so readers never see a partial file"""
+    # Serialize first, so a failure leaves no temporary file behind, then hand the
+    # whole payload to the OS without going through a buffered file object
+    payload = memoryview(dumps_json(data, indent=indent, default=default))
+    tmp_path = filepath.with_name(filepath.name + '.tmp')
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+        try:
+            while payload:
+                payload = payload[os.write(fd, payload):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
 
 def setup_logging(config: Config):
     """Setup logging configuration"""
@@ -290,20 +1052,75 @@ def setup_logging(config: Config):
     logger.info("Logging initialized")
 
 
+class _NoProgress:
+    """Stand-in for a rich Progress display that renders nothing"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def add_task(self, description: str, **kwargs) -> int:
+        return 0
+
+    def update(self, task_id: int, **kwargs):
+        pass
+
+
+def progress_spinner(console):
+    """Spinner progress display for interactive runs
+
+    Returns a no-op display when the console is not a terminal (cron, CI) or when
+    AKALYSIS_QUIET is set, so batch runs skip rich's refresh thread entirely.
+    """
+    if os.environ.get('AKALYSIS_QUIET') or not console.is_terminal:
+        return _NoProgress()
+
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+    )
+
+
+# Price lookups are kept for a short while, since CoinGecko rate-limits free users
+# and the price barely moves between calls. Keyed by price API URL
+_price_cache: Dict[Optional[str], Tuple[float, float]] = {}
+_price_lock = threading.Lock()
+_price_session = requests.Session()
+# Monotonic time of the last price failure warning, to log at most one per minute
+_price_warned_at = float('-inf')
+
+
 def get_akt_price(config: Config) -> float:
     """Fetch current AKT/USD price from CoinGecko"""
-    try:
-        price_api = config.get('processing', 'cost_calculation', 'price_api')
-        response = requests.get(price_api, timeout=10)
-        if response.status_code == 200:
-            data = response.json()
-            price = data.get('akash-network', {}).get('usd', 0)
-            logger.info(f"Current AKT price: ${price}")
-            return price
-    except Exception as e:
-        logger.warning(f"Failed to fetch AKT price: {e}, using default")
+    global _price_warned_at
 
-    return config.get('processing', 'cost_calculation', 'akt_usd_rate', default=3.5)
+    price_api = config.get('processing', 'cost_calculation', 'price_api')
+    ttl = config.get('processing', 'cost_calculation', 'price_cache_ttl', default=60)
+
+    with _price_lock:
+        cached = _price_cache.get(price_api)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        price = config.get('processing', 'cost_calculation', 'akt_usd_rate', default=3.5)
+        try:
+            response = _price_session.get(price_api, timeout=10)
+            if response.status_code == 200:
+                data = loads_json(response.content)
+                price = data.get('akash-network', {}).get('usd', 0)
+                logger.info(f"Current AKT price: ${price}")
+        except Exception as e:
+            if time.monotonic() - _price_warned_at >= 60:
+                logger.warning(f"Failed to fetch AKT price: {e}, using default")
+                _price_warned_at = time.monotonic()
+
+        # The default is cached too, so an unreachable API is not retried on every call
+        _price_cache[price_api] = (time.monotonic(), price)
+        return price
 
 
 def calculate_cost(amount_uakt: int, akt_price: float) -> float:
@@ -311,3 +1128,9 @@ def calculate_cost(amount_uakt: int, akt_price: float) -> float:
     # 1 AKT = 1,000,000 uAKT
     akt_amount = amount_uakt / 1_000_000
     return akt_amount * akt_price
+
+
+def calculate_cost_batch(amounts_uakt, akt_price: float) -> np.ndarray:
+    """Calculate USD costs for an array of uAKT amounts"""
+    # Same arithmetic as calculate_cost, so batch and scalar results agree exactly
+    return np.asarray(amounts_uakt, dtype=np.float64) / 1_000_000 * akt_price